@@ -3,8 +3,8 @@
 LinkedIn Authentication CLI
 
 Usage:
-    linkedin_auth.py login [--force-fresh-login] [--headless]
-    linkedin_auth.py scrape-jobs [--headless] [--filename=<f>] [--no-database] [--with-descriptions] [--max-descriptions=<n>]
+    linkedin_auth.py login [--force-fresh-login] [--headless | --windowed]
+    linkedin_auth.py scrape-jobs [--force-fresh-login] [--headless | --windowed] [--filename=<f>] [--no-database] [--with-descriptions] [--max-descriptions=<n>]
     linkedin_auth.py search-jobs [<query>] [--company=<c>] [--location=<l>] [--work-type=<wt>] [--min-salary=<min>] [--max-salary=<max>] [--limit=<n>]
     linkedin_auth.py db-stats
     linkedin_auth.py decrypt-cookies
@@ -15,7 +15,8 @@ Options:
     -h --help               Show this screen.
     --version               Show version.
     --force-fresh-login     Force a new login even if valid cookies exist.
-    --headless              Run browser in headless mode (no visible window).
+    --headless              Run browser in headless mode (default, no visible window).
+    --windowed              Run browser with a visible window (disables headless mode).
     --filename=<f>          Custom filename for job data (optional).
     --no-database           Skip database storage, only save to JSON file.
     --with-descriptions     Extract full job descriptions (slower, visits individual job pages).
@@ -30,10 +31,12 @@ Options:
 Examples:
     linkedin_auth.py login
     linkedin_auth.py login --force-fresh-login
+    linkedin_auth.py login --windowed  # Show the browser window
     linkedin_auth.py scrape-jobs
-    linkedin_auth.py scrape-jobs --headless --filename=my_jobs.json
+    linkedin_auth.py scrape-jobs --filename=my_jobs.json
     linkedin_auth.py scrape-jobs --no-database  # Skip database, JSON only
     linkedin_auth.py scrape-jobs --with-descriptions --max-descriptions=3  # Extract full job descriptions
+    linkedin_auth.py scrape-jobs --force-fresh-login  # Fresh login and scrape on one browser
     linkedin_auth.py search-jobs "software engineer" --company=Google --work-type=Remote
     linkedin_auth.py search-jobs --min-salary=100000 --max-salary=200000
     linkedin_auth.py db-stats
@@ -43,25 +46,232 @@ Examples:
 import json
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from docopt import docopt
 
-# Import from our library
+VERSION = "LinkedIn Auth 1.0"
+
+# Library modules are imported inside each subcommand so that --help,
+# search-jobs and db-stats never pay for the Selenium import graph.
 sys.path.insert(0, '.')
-from lib.linkedin_session import LinkedInSession
 
 
-def main() -> None:
-    """Main entry point for the LinkedIn authentication script."""
-    arguments = docopt(__doc__, version="LinkedIn Auth 1.0")
+def resolve_headless(arguments: Dict[str, Any], testing: bool) -> bool:
+    """
+    Decide whether the browser should run headless.
+
+    Headless is the default; ``--windowed`` opts out. Scripted runs
+    (``TESTING`` set) are always headless.
+
+    Args:
+        arguments: Parsed docopt arguments.
+        testing: Whether the TESTING environment variable is set.
+
+    Returns:
+        True if the browser should run without a visible window.
+    """
+    if testing:
+        return True
+    return not arguments.get("--windowed")
+
+
+# Terminal output longer than this (in characters) is sent to the pager
+PAGER_THRESHOLD = 8192
+
+
+def write_json(data: Any) -> None:
+    """
+    Write data to stdout as indented JSON.
+
+    On a terminal, output longer than PAGER_THRESHOLD is shown through the
+    system pager. Otherwise uses orjson when it is installed and stdout
+    exposes a binary buffer, falling back to the stdlib encoder.
+
+    Args:
+        data: JSON-serializable data to write.
+    """
+    if sys.stdout.isatty():
+        text = json.dumps(data, indent=2)
+        if len(text) > PAGER_THRESHOLD:
+            import pydoc
+            pydoc.pager(text)
+        else:
+            sys.stdout.write(text + "\n")
+        return
+
+    # Imported here so --help and --version never pay for it
+    try:
+        import orjson
+    except ImportError:  # Optional dependency; fall back to the stdlib encoder
+        orjson = None
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def format_search_results(jobs: List[Dict[str, Any]]) -> str:
+    """
+    Render search-jobs results as a single block of text.
+
+    Args:
+        jobs: Job rows as returned by JobDatabase.search_jobs().
+
+    Returns:
+        The formatted listing, newline-terminated.
+    """
+    lines = [f"\n=== Found {len(jobs)} matching jobs ==="]
+    for job in jobs:
+        lines.append(f"\nJob ID: {job['job_id']}")
+        lines.append(f"Title: {job['title']}")
+        lines.append(f"Company: {job['company']}")
+        if job['work_type']:
+            lines.append(f"Work Type: {job['work_type']}")
+        if job['location']:
+            lines.append(f"Location: {job['location']}")
+        if job['salary']:
+            lines.append(f"Salary: {job['salary']}")
+            if job['salary_min_yearly'] and job['salary_max_yearly']:
+                lines.append(f"Parsed Salary: ${job['salary_min_yearly']:,} - ${job['salary_max_yearly']:,}")
+        lines.append(f"Status: {job['status']}")
+        lines.append(f"First Seen: {job['first_seen']}")
+        lines.append(f"URL: {job['url']}")
+        lines.append("-" * 50)
+    return "\n".join(lines) + "\n"
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """
+    Render db-stats output as a single block of text.
+
+    Args:
+        stats: Statistics dictionary from JobDatabase.get_stats().
+
+    Returns:
+        The formatted report, newline-terminated.
+    """
+    lines = [
+        "\n=== Database Statistics ===",
+        f"Total Jobs: {stats['total_jobs']}",
+        f"Active Jobs: {stats['active_jobs']}",
+        f"Jobs Seen (Last 7 days): {stats['jobs_seen_last_7_days']}",
+        f"Total Scrape Sessions: {stats['total_sessions']}",
+    ]
+
+    lines.append("\nJobs by Status:")
+    lines.extend(f"  {status}: {count}" for status, count in stats['jobs_by_status'].items())
+
+    lines.append("\nWork Types:")
+    lines.extend(f"  {work_type}: {count}" for work_type, count in stats['work_types'].items())
+
+    lines.append("\nTop Companies:")
+    lines.extend(f"  {company}: {count}" for company, count in stats['top_companies'].items())
+
+    return "\n".join(lines) + "\n"
+
+
+def render_search(database: Any, query: Optional[str] = None, **filters: Any) -> str:
+    """
+    Run a job search and render the results as text.
+
+    Args:
+        database: JobDatabase (or compatible object) to query.
+        query: Optional full-text search query.
+        **filters: Keyword filters passed through to search_jobs()
+            (company, location, work_type, min_salary, max_salary, limit).
+
+    Returns:
+        The formatted listing, newline-terminated.
+    """
+    return format_search_results(database.search_jobs(query=query, **filters))
+
+
+def render_stats(database: Any) -> str:
+    """
+    Collect database statistics and render them as text.
+
+    Args:
+        database: JobDatabase (or compatible object) to report on.
+
+    Returns:
+        The formatted report, newline-terminated.
+    """
+    return format_stats(database.get_stats())
+
+
+# Integer options and the value used when docopt does not supply one
+INT_OPTION_DEFAULTS: Dict[str, Optional[int]] = {
+    "--max-descriptions": 5,
+    "--limit": 100,
+    "--min-salary": None,
+    "--max-salary": None,
+}
+
+
+def parse_int_options(arguments: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    """
+    Convert the integer-valued CLI options, exiting on invalid input.
+
+    Args:
+        arguments: Parsed docopt arguments.
+
+    Returns:
+        Mapping of option name to its integer value (or default).
+    """
+    numbers: Dict[str, Optional[int]] = {}
+    for option, default in INT_OPTION_DEFAULTS.items():
+        value = arguments.get(option)
+        if not value:
+            numbers[option] = default
+            continue
+        try:
+            numbers[option] = int(value)
+        except ValueError:
+            print(f"Error: {option} must be an integer")
+            sys.exit(1)
+    return numbers
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the LinkedIn authentication script.
+    
+    Args:
+        argv: Command-line arguments without the program name; defaults
+            to sys.argv[1:]
+    """
+    # Answer a leading --help/--version without building the usage pattern
+    first = (sys.argv[1:] if argv is None else argv)[:1]
+    if first in (["-h"], ["--help"]):
+        print(__doc__.strip("\n"))
+        sys.exit()
+    if first == ["--version"]:
+        print(VERSION)
+        sys.exit()
+    
+    arguments = docopt(__doc__, argv=argv, version=VERSION)
+    # Validate numeric options before any browser or database startup
+    numbers = parse_int_options(arguments)
+    # Read once so behaviour cannot change partway through a run
+    testing = bool(os.getenv("TESTING"))
     
     if arguments["login"]:
-        headless = arguments.get("--headless")
+        from lib.linkedin_session import LinkedInSession
+
+        headless = resolve_headless(arguments, testing)
         force_fresh = arguments.get("--force-fresh-login")
         
         # Use the LinkedInSession from our library
         session = LinkedInSession(headless=headless)
+        success = False
         
         try:
             success = session.login(force_fresh=force_fresh)
@@ -73,25 +283,31 @@ def main() -> None:
                 print("\n✗ LinkedIn authentication failed.")
                 sys.exit(1)
         finally:
-            # Skip input prompt in test environment
-            if not os.getenv("TESTING"):
+            # Only prompt after a successful interactive run; failures exit
+            # straight away and tests/non-interactive runs never block
+            if success and not testing and sys.stdin.isatty():
                 input("Hit <enter> to close this session.")
             session.close_session()
     
     elif arguments["scrape-jobs"]:
-        headless = arguments.get("--headless")
+        from lib.linkedin_session import LinkedInSession
+
+        headless = resolve_headless(arguments, testing)
+        force_fresh = arguments.get("--force-fresh-login")
         filename = arguments.get("--filename")
         use_database = not arguments.get("--no-database")
         with_descriptions = arguments.get("--with-descriptions")
-        max_descriptions = int(arguments.get("--max-descriptions", 5))
+        max_descriptions = numbers["--max-descriptions"]
 
         # Use the LinkedInSession from our library
         session = LinkedInSession(headless=headless, enable_database=use_database)
+        completed = False
 
         try:
-            # First login (will use existing cookies if valid)
+            # Log in on the same browser used for scraping (reuses existing
+            # cookies if valid unless --force-fresh-login is given)
             print("Authenticating with LinkedIn...")
-            success = session.login(force_fresh=False)
+            success = session.login(force_fresh=force_fresh)
 
             if not success:
                 print("\n✗ LinkedIn authentication failed. Cannot scrape jobs.")
@@ -134,12 +350,15 @@ def main() -> None:
                 else:
                     print("\n⚠ No jobs found. Check page structure or authentication.")
 
+            completed = True
+
         except Exception as e:
             print(f"\n✗ Error during job scraping: {e}")
             sys.exit(1)
         finally:
-            # Skip input prompt in test environment
-            if not os.getenv("TESTING"):
+            # Only prompt after a successful interactive run; failures exit
+            # straight away and tests/non-interactive runs never block
+            if completed and not testing and sys.stdin.isatty():
                 input("Hit <enter> to close this session.")
             session.close_session()
 
@@ -150,54 +369,23 @@ def main() -> None:
         company = arguments.get("--company")
         location = arguments.get("--location")
         work_type = arguments.get("--work-type")
-        min_salary = arguments.get("--min-salary")
-        max_salary = arguments.get("--max-salary")
-        limit = int(arguments.get("--limit", 100))
-
-        # Convert salary strings to integers if provided
-        if min_salary:
-            try:
-                min_salary = int(min_salary)
-            except ValueError:
-                print("Error: --min-salary must be an integer")
-                sys.exit(1)
-
-        if max_salary:
-            try:
-                max_salary = int(max_salary)
-            except ValueError:
-                print("Error: --max-salary must be an integer")
-                sys.exit(1)
+        min_salary = numbers["--min-salary"]
+        max_salary = numbers["--max-salary"]
+        limit = numbers["--limit"]
 
         try:
             database = JobDatabase()
-            jobs = database.search_jobs(
-                query=query,
+            # One write for the whole listing instead of ~10 prints per job
+            sys.stdout.write(render_search(
+                database,
+                query,
                 company=company,
                 location=location,
                 work_type=work_type,
                 min_salary=min_salary,
                 max_salary=max_salary,
                 limit=limit
-            )
-
-            print(f"\n=== Found {len(jobs)} matching jobs ===")
-            for job in jobs:
-                print(f"\nJob ID: {job['job_id']}")
-                print(f"Title: {job['title']}")
-                print(f"Company: {job['company']}")
-                if job['work_type']:
-                    print(f"Work Type: {job['work_type']}")
-                if job['location']:
-                    print(f"Location: {job['location']}")
-                if job['salary']:
-                    print(f"Salary: {job['salary']}")
-                    if job['salary_min_yearly'] and job['salary_max_yearly']:
-                        print(f"Parsed Salary: ${job['salary_min_yearly']:,} - ${job['salary_max_yearly']:,}")
-                print(f"Status: {job['status']}")
-                print(f"First Seen: {job['first_seen']}")
-                print(f"URL: {job['url']}")
-                print("-" * 50)
+            ))
 
         except Exception as e:
             print(f"Error searching jobs: {e}")
@@ -208,37 +396,22 @@ def main() -> None:
 
         try:
             database = JobDatabase()
-            stats = database.get_stats()
-
-            print("\n=== Database Statistics ===")
-            print(f"Total Jobs: {stats['total_jobs']}")
-            print(f"Active Jobs: {stats['active_jobs']}")
-            print(f"Jobs Seen (Last 7 days): {stats['jobs_seen_last_7_days']}")
-            print(f"Total Scrape Sessions: {stats['total_sessions']}")
-
-            print(f"\nJobs by Status:")
-            for status, count in stats['jobs_by_status'].items():
-                print(f"  {status}: {count}")
-
-            print(f"\nWork Types:")
-            for work_type, count in stats['work_types'].items():
-                print(f"  {work_type}: {count}")
-
-            print(f"\nTop Companies:")
-            for company, count in stats['top_companies'].items():
-                print(f"  {company}: {count}")
+            # Render the report up front and emit it with one write
+            sys.stdout.write(render_stats(database))
 
         except Exception as e:
             print(f"Error getting database stats: {e}")
             sys.exit(1)
 
     elif arguments["decrypt-cookies"]:
+        from lib.linkedin_session import LinkedInSession
+
         session = LinkedInSession()
         cookie_data = session.decrypt_cookies()
 
         if cookie_data:
             print("\n=== Decrypted Cookie Data ===")
-            print(json.dumps(cookie_data, indent=2))
+            write_json(cookie_data)
         else:
             print("No cookie file found or unable to decrypt")
 
@@ -0,0 +1,141 @@
+"""
+Shared pytest fixtures for the CLI and database test suites, plus the
+opt-in --skip-fts selection and --db-profile SQLite statement report.
+"""
+
+import re
+import sqlite3
+from collections import Counter
+from contextlib import closing
+
+import pytest
+from unittest.mock import Mock
+
+
+# LinkedInSession methods the CLI calls; nothing needs magic-method support
+SESSION_METHODS = [
+    'login',
+    'close_session',
+    'decrypt_cookies',
+    'scrape_jobs',
+    'save_jobs_to_file',
+    'scrape_jobs_to_database',
+    'scrape_jobs_with_descriptions_to_database',
+]
+
+
+@pytest.fixture
+def session_mock():
+    """
+    Create a mock LinkedInSession instance for CLI tests.
+
+    A fresh mock is built per test so call records never leak between
+    tests. It is a plain Mock limited to SESSION_METHODS, so calls to
+    anything else fail loudly. login() succeeds by default; tests
+    override return values as needed.
+    """
+    session = Mock(spec_set=SESSION_METHODS)
+    session.login.return_value = True
+    return session
+
+
+@pytest.fixture
+def session_class(monkeypatch, session_mock):
+    """
+    Replace LinkedInSession with a mock class that returns session_mock.
+
+    Uses a direct attribute swap (restored automatically at teardown)
+    rather than a unittest.mock.patch context manager.
+    """
+    session_class = Mock(return_value=session_mock)
+    monkeypatch.setattr("lib.linkedin_session.LinkedInSession", session_class)
+    return session_class
+
+
+@pytest.fixture(scope="session")
+def seed_db_path(tmp_path_factory):
+    """
+    Build the JobDatabase schema once per session and return its path.
+
+    Tests that only inspect the schema can open this file read-only;
+    tests that write rows should use fresh_db_path instead.
+    """
+    from lib.job_database import JobDatabase
+
+    path = tmp_path_factory.mktemp("seed") / "jobs.db"
+    JobDatabase(db_path=path)
+    return path
+
+
+@pytest.fixture
+def fresh_db_path(seed_db_path, tmp_path):
+    """
+    Copy the seeded database into a per-test file and return its path.
+
+    Uses the SQLite backup API, so the copy is consistent whatever
+    journal mode the schema was built with.
+    """
+    path = tmp_path / "test.db"
+    with closing(sqlite3.connect(seed_db_path)) as src, closing(sqlite3.connect(path)) as dst:
+        src.backup(dst)
+    return path
+
+
+# Statement counts collected under --db-profile, keyed by normalized SQL
+_sql_counts = Counter()
+
+# String and numeric literals, replaced so bound values do not split counts
+_SQL_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def pytest_addoption(parser):
+    """Register the --skip-fts and --db-profile command-line flags."""
+    parser.addoption(
+        "--skip-fts", action="store_true", default=False,
+        help="Deselect tests marked fts (full-text index); same as -m 'not fts'.",
+    )
+    parser.addoption(
+        "--db-profile", action="store_true", default=False,
+        help="Count the SQLite statements run by the tests and report the top 20.",
+    )
+
+
+def _record_statement(sql):
+    """Trace callback: count one executed statement with literals masked."""
+    _sql_counts[_SQL_LITERAL.sub("?", " ".join(sql.split()))] += 1
+
+
+def pytest_configure(config):
+    """Under --db-profile, trace every connection opened via sqlite3.connect."""
+    if not config.getoption("--db-profile"):
+        return
+
+    real_connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(_record_statement)
+        return conn
+
+    sqlite3.connect = traced_connect
+    config.add_cleanup(lambda: setattr(sqlite3, "connect", real_connect))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Under --skip-fts, deselect the tests marked fts."""
+    if not config.getoption("--skip-fts"):
+        return
+    selected = [item for item in items if item.get_closest_marker("fts") is None]
+    deselected = [item for item in items if item.get_closest_marker("fts") is not None]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the most frequently executed statements at session end."""
+    if not config.getoption("--db-profile"):
+        return
+    terminalreporter.section("SQLite statements (top 20 by count)")
+    for sql, count in _sql_counts.most_common(20):
+        terminalreporter.write_line(f"{count:8d}  {sql[:160]}")
@@ -25,9 +25,9 @@ from lib.linkedin_session import LinkedInSession
 class TestAuthenticationStackTraceBug:
     """Test the specific authentication stack trace logging issue."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def session(self):
-        """Create a LinkedInSession instance for testing."""
+        """Create one LinkedInSession shared by the class; each test installs its own mock driver."""
         with patch('lib.linkedin_session.load_dotenv'):
             with patch('lib.linkedin_session.Path.mkdir'):
                 return LinkedInSession(encryption_key='rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs=', headless=True)
@@ -170,10 +170,13 @@ class TestAuthenticationStackTraceBug:
         ]
 
         all_stderr_output = []
+        stderr_capture = io.StringIO()
 
         for i, exception in enumerate(exceptions):
             mock_driver.find_element.side_effect = exception
-            stderr_capture = io.StringIO()
+            # Reuse one buffer across attempts
+            stderr_capture.seek(0)
+            stderr_capture.truncate(0)
 
             with patch.object(session, 'save_page_state'):
                 with redirect_stderr(stderr_capture):
@@ -237,9 +240,9 @@ class TestAuthenticationStackTraceBug:
 class TestAuthenticationDebugMessageFix:
     """Test the correct implementation after fixing the authentication debug message."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def session(self):
-        """Create a LinkedInSession instance for testing."""
+        """Create one LinkedInSession shared by the class; each test installs its own mock driver."""
         with patch('lib.linkedin_session.load_dotenv'):
             with patch('lib.linkedin_session.Path.mkdir'):
                 return LinkedInSession(encryption_key='rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs=', headless=True)
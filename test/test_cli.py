@@ -9,213 +9,172 @@ import json
 import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
-from io import StringIO
+from unittest.mock import MagicMock, call
 
-# Add the project root to the path for imports
-sys.path.insert(0, '.')
+# The project root is put on sys.path by pytest.ini (pythonpath = .)
 from script.linkedin_auth import main
 import script.linkedin_auth as cli_module
 
 
+# Decrypted cookie payloads shared by the decrypt-cookies tests
+_COOKIE_DATA_SINGLE = {
+    'cookies': [{'name': 'test_cookie', 'value': 'test_value'}],
+    'timestamp': '2023-01-01T10:00:00',
+    'expiry': '2023-01-31T10:00:00'
+}
+
+_COOKIE_DATA_MULTI = {
+    'cookies': [
+        {'name': 'cookie1', 'value': 'value1'},
+        {'name': 'cookie2', 'value': 'value2'}
+    ],
+    'timestamp': '2023-01-01T10:00:00'
+}
+
+
+@pytest.fixture(scope='module')
+def doc():
+    """Usage docstring shared by the docopt parsing tests."""
+    return cli_module.__doc__
+
+
 class TestLinkedInAuthCLI:
     """Test LinkedIn authentication CLI script functionality."""
     
-    def test_main_login_success(self, capsys):
+    @pytest.mark.parametrize('login_result,expect_exit,expected_lines', [
+        (True, None, ("✓ LinkedIn authentication completed successfully!",
+                      "Session cookies have been saved")),
+        (False, 1, ("✗ LinkedIn authentication failed.",)),
+        (Exception("Test exception"), 'raises', ()),
+    ])
+    def test_main_login_outcomes(self, session_class, session_mock, capsys,
+                                 login_result, expect_exit, expected_lines):
         """
-        Test successful CLI login execution.
+        Test CLI login success, failure and exception handling.
         
-        This test verifies that the main function correctly handles a successful
-        login command and displays appropriate success messages.
-        """
-        # Mock command line arguments for login
-        test_args = ['linkedin_auth.py', 'login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                # Mock successful login
-                mock_session = MagicMock()
-                mock_session.login.return_value = True
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify session was created with correct parameters
-                mock_session_class.assert_called_once_with(headless=False)
-                
-                # Verify login was called with correct parameters
-                mock_session.login.assert_called_once_with(force_fresh=False)
-                
-                # Verify session was closed
-                mock_session.close_session.assert_called_once()
-                
-                # Check success message
-                captured = capsys.readouterr()
-                assert "✓ LinkedIn authentication completed successfully!" in captured.out
-                assert "Session cookies have been saved" in captured.out
-    
-    def test_main_login_failure(self, capsys):
+        This test verifies the messages and exit code for each login
+        outcome, and that the browser session is closed in every case,
+        including when login() raises.
         """
-        Test CLI login failure handling.
+        test_args = ['login']
         
-        This test verifies that login failures are properly handled with
-        appropriate error messages and exit codes.
-        """
-        test_args = ['linkedin_auth.py', 'login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                with patch('sys.exit') as mock_exit:
-                    # Mock failed login
-                    mock_session = MagicMock()
-                    mock_session.login.return_value = False
-                    mock_session_class.return_value = mock_session
-                    
-                    main()
-                    
-                    # Verify login was attempted
-                    mock_session.login.assert_called_once()
-                    
-                    # Verify session was closed even after failure
-                    mock_session.close_session.assert_called_once()
-                    
-                    # Check failure message and exit code
-                    captured = capsys.readouterr()
-                    assert "✗ LinkedIn authentication failed." in captured.out
-                    mock_exit.assert_called_once_with(1)
+        if isinstance(login_result, Exception):
+            session_mock.login.side_effect = login_result
+        else:
+            session_mock.login.return_value = login_result
+        
+        if expect_exit is None:
+            main(test_args)
+        elif expect_exit == 'raises':
+            with pytest.raises(Exception, match=str(login_result)):
+                main(test_args)
+        else:
+            with pytest.raises(SystemExit) as exc_info:
+                main(test_args)
+            assert exc_info.value.code == expect_exit
+        
+        # Session is created headless (the default) and always closed after login
+        session_class.assert_called_once_with(headless=True)
+        assert session_mock.method_calls == [call.login(force_fresh=False), call.close_session()]
+        
+        out = capsys.readouterr().out
+        for line in expected_lines:
+            assert line in out
     
-    def test_main_decrypt_cookies(self, capsys):
+    def test_main_decrypt_cookies(self, session_class, session_mock, capsys):
         """
         Test decrypt-cookies command execution.
         
         This test verifies that the decrypt-cookies command properly
         decrypts and displays cookie data.
         """
-        test_args = ['linkedin_auth.py', 'decrypt-cookies']
-        cookie_data = {
-            'cookies': [{'name': 'test_cookie', 'value': 'test_value'}],
-            'timestamp': '2023-01-01T10:00:00',
-            'expiry': '2023-01-31T10:00:00'
-        }
+        test_args = ['decrypt-cookies']
+        
+        session_mock.decrypt_cookies.return_value = _COOKIE_DATA_SINGLE
+        
+        main(test_args)
+        out = capsys.readouterr().out
         
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.decrypt_cookies.return_value = cookie_data
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify decrypt_cookies was called
-                mock_session.decrypt_cookies.assert_called_once()
-                
-                # Check output
-                captured = capsys.readouterr()
-                assert "=== Decrypted Cookie Data ===" in captured.out
-                assert "test_cookie" in captured.out
-                assert "test_value" in captured.out
+        # Verify decrypt_cookies was the only session call
+        assert session_mock.method_calls == [call.decrypt_cookies()]
+        
+        # Check output
+        assert "=== Decrypted Cookie Data ===" in out
+        assert "test_cookie" in out
+        assert "test_value" in out
     
-    def test_main_decrypt_cookies_missing(self, capsys):
+    def test_main_decrypt_cookies_missing(self, session_class, session_mock, capsys):
         """
         Test decrypt-cookies when no cookies exist.
         
         This test verifies appropriate messaging when no cookie file
         is found or decryption fails.
         """
-        test_args = ['linkedin_auth.py', 'decrypt-cookies']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.decrypt_cookies.return_value = None
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                captured = capsys.readouterr()
-                assert "No cookie file found or unable to decrypt" in captured.out
-    
-    def test_cli_login_command(self):
-        """
-        Test parsing of basic login command.
+        test_args = ['decrypt-cookies']
         
-        This test verifies that the docopt argument parsing correctly
-        handles the basic login command without additional flags.
-        """
-        test_args = ['linkedin_auth.py', 'login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.login.return_value = True
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify correct parameters were passed
-                mock_session_class.assert_called_once_with(headless=False)
-                mock_session.login.assert_called_once_with(force_fresh=False)
+        session_mock.decrypt_cookies.return_value = None
+        
+        main(test_args)
+        
+        captured = capsys.readouterr()
+        assert "No cookie file found or unable to decrypt" in captured.out
     
-    def test_cli_login_force_fresh(self):
+    @pytest.mark.parametrize('extra_argv,headless,force_fresh', [
+        ([], True, False),
+        (['--force-fresh-login'], True, True),
+        (['--headless'], True, False),
+        (['--headless', '--force-fresh-login'], True, True),
+    ])
+    def test_cli_login_flags(self, session_class, session_mock,
+                             extra_argv, headless, force_fresh):
         """
-        Test parsing of login command with --force-fresh-login flag.
+        Test parsing of the login command and its flag combinations.
         
-        This test verifies that the --force-fresh-login flag is properly
-        parsed and passed to the login method.
+        This test verifies that --headless and --force-fresh-login are
+        properly parsed and passed to the LinkedInSession constructor and
+        the login method respectively (headless is the default).
         """
-        test_args = ['linkedin_auth.py', 'login', '--force-fresh-login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.login.return_value = True
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify force_fresh flag was passed
-                mock_session.login.assert_called_once_with(force_fresh=True)
+        test_args = ['login', *extra_argv]
+        
+        main(test_args)
+        
+        session_class.assert_called_once_with(headless=headless)
+        session_mock.login.assert_called_once_with(force_fresh=force_fresh)
     
-    def test_cli_login_headless(self):
+    def test_cli_login_windowed(self, session_class, session_mock, monkeypatch):
         """
-        Test parsing of login command with --headless flag.
+        Test parsing of login command with --windowed flag.
         
-        This test verifies that the --headless flag is properly parsed
-        and passed to the LinkedInSession constructor.
+        This test verifies that --windowed opts out of the default
+        headless mode when not running under TESTING.
         """
-        test_args = ['linkedin_auth.py', 'login', '--headless']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.login.return_value = True
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify headless flag was passed
-                mock_session_class.assert_called_once_with(headless=True)
+        test_args = ['login', '--windowed']
+        
+        monkeypatch.setenv('TESTING', '')
+        monkeypatch.setattr('builtins.input', MagicMock())
+        
+        main(test_args)
+        
+        # Verify the browser window is shown
+        session_class.assert_called_once_with(headless=False)
     
-    def test_cli_login_headless_force_fresh(self):
+    def test_scrape_jobs_force_fresh_login(self, session_class, session_mock):
         """
-        Test parsing of login command with combined --headless and --force-fresh-login flags.
+        Test scrape-jobs with --force-fresh-login.
         
-        This test verifies that multiple flags can be combined and are
-        properly parsed and passed to their respective functions.
+        This test verifies that a fresh login and the scrape run on the
+        same LinkedInSession, so only one browser is started.
         """
-        test_args = ['linkedin_auth.py', 'login', '--headless', '--force-fresh-login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.login.return_value = True
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                # Verify both flags were passed correctly
-                mock_session_class.assert_called_once_with(headless=True)
-                mock_session.login.assert_called_once_with(force_fresh=True)
+        test_args = ['scrape-jobs', '--force-fresh-login', '--no-database']
+        
+        session_mock.scrape_jobs.return_value = []
+        
+        main(test_args)
+        
+        session_class.assert_called_once_with(headless=True, enable_database=False)
+        session_mock.login.assert_called_once_with(force_fresh=True)
+        session_mock.scrape_jobs.assert_called_once_with(show_all=True)
+        session_mock.close_session.assert_called_once()
     
     def test_cli_help(self, capsys):
         """
@@ -224,21 +183,17 @@ class TestLinkedInAuthCLI:
         This test verifies that the --help flag displays the docstring
         usage information and exits cleanly.
         """
-        test_args = ['linkedin_auth.py', '--help']
-        
-        with patch('sys.argv', test_args):
-            with patch('sys.exit') as mock_exit:
-                try:
-                    main()
-                except SystemExit:
-                    pass  # docopt calls sys.exit after showing help
-                
-                captured = capsys.readouterr()
-                # Should contain usage information from docstring
-                assert "Usage:" in captured.out
-                assert "linkedin_auth.py login" in captured.out
-                assert "linkedin_auth.py decrypt-cookies" in captured.out
-                assert "Options:" in captured.out
+        with pytest.raises(SystemExit) as exc_info:
+            main(['--help'])
+        
+        assert exc_info.value.code is None
+        out = capsys.readouterr().out
+        
+        # Should contain usage information from docstring
+        assert "Usage:" in out
+        assert "linkedin_auth.py login" in out
+        assert "linkedin_auth.py decrypt-cookies" in out
+        assert "Options:" in out
     
     def test_cli_version(self, capsys):
         """
@@ -247,42 +202,66 @@ class TestLinkedInAuthCLI:
         This test verifies that the --version flag displays the
         version string and exits cleanly.
         """
-        test_args = ['linkedin_auth.py', '--version']
-        
-        with patch('sys.argv', test_args):
-            with patch('sys.exit') as mock_exit:
-                try:
-                    main()
-                except SystemExit:
-                    pass  # docopt calls sys.exit after showing version
-                
-                captured = capsys.readouterr()
-                # Should contain version information
-                assert "LinkedIn Auth 1.0" in captured.out
+        with pytest.raises(SystemExit) as exc_info:
+            main(['--version'])
+        
+        assert exc_info.value.code is None
+        # Should contain version information
+        assert capsys.readouterr().out.strip() == cli_module.VERSION == "LinkedIn Auth 1.0"
     
-    def test_session_cleanup_on_exception(self):
+    def test_no_prompt_when_stdin_not_tty(self, session_class, session_mock, monkeypatch):
         """
-        Test that browser session is cleaned up even when exceptions occur.
+        Test that the close-session prompt is skipped for non-interactive runs.
         
-        This test verifies that the finally block properly closes the
-        browser session even if an exception is raised during login.
+        This test verifies that cron/CI/pipe invocations (stdin not a TTY)
+        never block on input() even when TESTING is unset.
         """
-        test_args = ['linkedin_auth.py', 'login']
-        
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.login.side_effect = Exception("Test exception")
-                mock_session_class.return_value = mock_session
-                
-                # Should not raise exception due to try/finally
-                with pytest.raises(Exception, match="Test exception"):
-                    main()
-                
-                # Session should still be closed
-                mock_session.close_session.assert_called_once()
+        test_args = ['login']
+        
+        monkeypatch.setenv('TESTING', '')
+        mock_stdin = MagicMock()
+        monkeypatch.setattr(sys, 'stdin', mock_stdin)
+        mock_stdin.isatty.return_value = False
+        mock_input = MagicMock()
+        monkeypatch.setattr('builtins.input', mock_input)
+        
+        main(test_args)
+        
+        mock_input.assert_not_called()
+        session_mock.close_session.assert_called_once()
     
-    def test_docopt_integration(self):
+    def test_no_prompt_after_failed_login(self, session_class, session_mock, monkeypatch):
+        """
+        Test that a failed login exits without waiting for <enter>.
+        
+        This test verifies that even an interactive run skips the
+        close-session prompt when authentication fails, while the
+        browser session is still closed.
+        """
+        test_args = ['login']
+        
+        monkeypatch.setenv('TESTING', '')
+        mock_stdin = MagicMock()
+        monkeypatch.setattr(sys, 'stdin', mock_stdin)
+        mock_stdin.isatty.return_value = True
+        mock_input = MagicMock()
+        monkeypatch.setattr('builtins.input', mock_input)
+        session_mock.login.return_value = False
+        
+        with pytest.raises(SystemExit):
+            main(test_args)
+        
+        mock_input.assert_not_called()
+        session_mock.close_session.assert_called_once()
+    
+    @pytest.mark.parametrize('argv,expected_flags', [
+        (['login'], {'login': True, '--force-fresh-login': False, '--headless': False}),
+        (['login', '--headless'], {'login': True, '--headless': True}),
+        (['login', '--force-fresh-login'], {'login': True, '--force-fresh-login': True}),
+        (['login', '--windowed'], {'login': True, '--windowed': True, '--headless': False}),
+        (['decrypt-cookies'], {'decrypt-cookies': True, 'login': False}),
+    ])
+    def test_docopt_parses(self, doc, argv, expected_flags):
         """
         Test integration with docopt argument parsing.
         
@@ -291,55 +270,70 @@ class TestLinkedInAuthCLI:
         """
         from docopt import docopt
         
-        # Test parsing various command combinations
-        test_cases = [
-            (['login'], {'login': True, '--force-fresh-login': False, '--headless': False}),
-            (['login', '--headless'], {'login': True, '--headless': True}),
-            (['login', '--force-fresh-login'], {'login': True, '--force-fresh-login': True}),
-            (['decrypt-cookies'], {'decrypt-cookies': True, 'login': False})
-        ]
-        
-        for args, expected_flags in test_cases:
-            parsed_args = docopt(cli_module.__doc__, argv=args, version="LinkedIn Auth 1.0")
-            
-            for flag, expected_value in expected_flags.items():
-                assert parsed_args[flag] == expected_value, f"Failed for args {args}, flag {flag}"
+        parsed_args = docopt(doc, argv=argv, version=cli_module.VERSION)
+        
+        for flag, expected_value in expected_flags.items():
+            assert parsed_args[flag] == expected_value, f"Failed for args {argv}, flag {flag}"
     
-    def test_json_output_formatting(self, capsys):
+    def test_json_output_formatting(self, session_class, session_mock, capsys):
         """
         Test that JSON output is properly formatted for decrypt-cookies command.
         
         This test verifies that cookie data is displayed in a readable
         JSON format with proper indentation.
         """
-        test_args = ['linkedin_auth.py', 'decrypt-cookies']
+        test_args = ['decrypt-cookies']
+        
+        session_mock.decrypt_cookies.return_value = _COOKIE_DATA_MULTI
+        
+        main(test_args)
+        
+        captured = capsys.readouterr()
+        payload = captured.out.split('=== Decrypted Cookie Data ===\n', 1)[1]
+        
+        # Verify JSON is indented and parses back to the original data
+        assert '\n  ' in payload
+        assert json.loads(payload) == _COOKIE_DATA_MULTI
+    
+    def test_json_output_without_orjson(self, session_class, session_mock, capsys, monkeypatch):
+        """
+        Test decrypt-cookies JSON output when orjson is not installed.
+        
+        This test verifies that the stdlib fallback produces the same
+        indented, parseable JSON as the orjson path.
+        """
+        test_args = ['decrypt-cookies']
+        
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        session_mock.decrypt_cookies.return_value = _COOKIE_DATA_SINGLE
+        
+        main(test_args)
+        
+        captured = capsys.readouterr()
+        payload = captured.out.split('=== Decrypted Cookie Data ===\n', 1)[1]
+        assert '\n  ' in payload
+        assert json.loads(payload) == _COOKIE_DATA_SINGLE
+    
+    def test_large_json_output_uses_pager_on_tty(self, session_class, session_mock, monkeypatch):
+        """
+        Test that large decrypt-cookies output is paged on a terminal.
+        
+        This test verifies that output above PAGER_THRESHOLD goes through
+        pydoc.pager instead of being written directly.
+        """
+        test_args = ['decrypt-cookies']
         cookie_data = {
-            'cookies': [
-                {'name': 'cookie1', 'value': 'value1'},
-                {'name': 'cookie2', 'value': 'value2'}
-            ],
-            'timestamp': '2023-01-01T10:00:00'
+            'cookies': [{'name': f'cookie{i}', 'value': 'x' * 100} for i in range(100)]
         }
         
-        with patch('sys.argv', test_args):
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                mock_session = MagicMock()
-                mock_session.decrypt_cookies.return_value = cookie_data
-                mock_session_class.return_value = mock_session
-                
-                main()
-                
-                captured = capsys.readouterr()
-                
-                # Verify JSON is properly formatted (indented)
-                assert '"cookies": [' in captured.out
-                assert '  {' in captured.out  # Should have indentation
-                assert '"name": "cookie1"' in captured.out
-                
-                # Verify it's valid JSON by parsing it
-                json_start = captured.out.find('{')
-                json_end = captured.out.rfind('}') + 1
-                json_output = captured.out[json_start:json_end]
-                
-                parsed_data = json.loads(json_output)
-                assert parsed_data == cookie_data
\ No newline at end of file
+        mock_stdout = MagicMock()
+        monkeypatch.setattr(sys, 'stdout', mock_stdout)
+        mock_stdout.isatty.return_value = True
+        mock_pager = MagicMock()
+        monkeypatch.setattr('pydoc.pager', mock_pager)
+        session_mock.decrypt_cookies.return_value = cookie_data
+        
+        main(test_args)
+        
+        mock_pager.assert_called_once()
+        assert json.loads(mock_pager.call_args[0][0]) == cookie_data
@@ -6,348 +6,418 @@ from the database and displaying database statistics. Following TDD principles
 to ensure robust CLI behavior and proper error handling.
 """
 
-import json
-import sys
-from io import StringIO
-from unittest.mock import patch, MagicMock, call
+from contextlib import ExitStack
+from types import MappingProxyType
+from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Import the main function that needs testing
-sys.path.insert(0, '.')
-from script.linkedin_auth import main
+# Import the main function that needs testing (project root is on
+# sys.path via pytest.ini)
+import script.linkedin_auth as cli_module
+from script.linkedin_auth import main, format_search_results, format_stats, render_search
+
+
+# Parsed docopt arguments for each command (read-only); tests derive variants
+# with docopt_args()
+BASE_SEARCH_ARGS = MappingProxyType({
+    'login': False,
+    'scrape-jobs': False,
+    'search-jobs': True,
+    'db-stats': False,
+    'decrypt-cookies': False,
+    '<query>': None,
+    '--company': None,
+    '--location': None,
+    '--work-type': None,
+    '--min-salary': None,
+    '--max-salary': None,
+    '--limit': '100'
+})
+
+BASE_STATS_ARGS = MappingProxyType({
+    'login': False,
+    'scrape-jobs': False,
+    'search-jobs': False,
+    'db-stats': True,
+    'decrypt-cookies': False
+})
+
+
+def docopt_args(base, overrides=None):
+    """
+    Build a read-only docopt result from a base template.
+
+    main() only reads its arguments, so a MappingProxyType turns any
+    accidental mutation into a TypeError.
+    """
+    return MappingProxyType(base | (overrides or {}))
+
+
+# Keyword arguments main() passes to JobDatabase.search_jobs by default
+DEFAULT_SEARCH_KWARGS = {
+    'query': None,
+    'company': None,
+    'location': None,
+    'work_type': None,
+    'min_salary': None,
+    'max_salary': None,
+    'limit': 100
+}
+
+# Search results returned by the mocked JobDatabase
+ONE_JOB = [
+    {
+        'job_id': 'cli_test_1',
+        'title': 'Python Developer',
+        'company': 'TechCorp',
+        'work_type': 'Remote',
+        'location': 'San Francisco, CA',
+        'salary': '$100K/yr - $120K/yr',
+        'salary_min_yearly': 100000,
+        'salary_max_yearly': 120000,
+        'status': 'active',
+        'first_seen': '2024-01-15 10:30:00',
+        'url': 'https://linkedin.com/jobs/view/cli_test_1'
+    }
+]
+
+TWO_JOBS = [
+    {
+        'job_id': 'multi_1',
+        'title': 'Senior Python Developer',
+        'company': 'TechCorp',
+        'work_type': 'Remote',
+        'location': 'Remote',
+        'salary': '$130K/yr - $150K/yr',
+        'salary_min_yearly': 130000,
+        'salary_max_yearly': 150000,
+        'status': 'active',
+        'first_seen': '2024-01-15 10:30:00',
+        'url': 'https://linkedin.com/jobs/view/multi_1'
+    },
+    {
+        'job_id': 'multi_2',
+        'title': 'Data Scientist',
+        'company': 'DataCorp',
+        'work_type': None,  # Test None work_type
+        'location': 'New York, NY',
+        'salary': None,  # Test None salary
+        'salary_min_yearly': None,
+        'salary_max_yearly': None,
+        'status': 'active',
+        'first_seen': '2024-01-15 11:00:00',
+        'url': 'https://linkedin.com/jobs/view/multi_2'
+    }
+]
+
+
+# Commands, options and examples the CLI usage docstring must mention
+REQUIRED_DOC_TOKENS = frozenset({
+    # Commands
+    'search-jobs',
+    'db-stats',
+    'login',
+    'decrypt-cookies',
+    # search-jobs options
+    '--company',
+    '--location',
+    '--work-type',
+    '--min-salary',
+    '--max-salary',
+    '--limit',
+    # login/scrape options
+    '--force-fresh-login',
+    '--headless',
+    '--with-descriptions',
+    '--max-descriptions',
+    '--no-database',
+    # Examples
+    'Examples:',
+    'linkedin_auth.py search-jobs',
+    'linkedin_auth.py db-stats'
+})
+
+
+def split_job_blocks(output):
+    """
+    Split search-jobs output into one set of lines per job.
+
+    A block starts at each "Job ID:" line and runs until the next one.
+    """
+    blocks = []
+    for line in output.splitlines():
+        if line.startswith("Job ID: "):
+            blocks.append(set())
+        if blocks:
+            blocks[-1].add(line)
+    return blocks
+
+
+class FakeDB:
+    """
+    Hand-rolled stand-in for JobDatabase.
+
+    Installed in place of the JobDatabase class itself: calling it opens
+    the "database" (or raises open_error) and returns the same instance,
+    which records each search and serves canned results.
+    """
+
+    def __init__(self):
+        self.search_result = []
+        self.stats = None
+        self.open_error = None
+        self.query_error = None
+        self.opened = False
+        self.search_calls = []
+
+    def __call__(self):
+        if self.open_error:
+            raise self.open_error
+        self.opened = True
+        return self
+
+    def search_jobs(self, **kwargs):
+        if self.query_error:
+            raise self.query_error
+        self.search_calls.append(kwargs)
+        return self.search_result
+
+    def get_stats(self):
+        if self.query_error:
+            raise self.query_error
+        return self.stats
+
+
+@pytest.fixture
+def mock_cli(monkeypatch):
+    """
+    Replace docopt with a mock and JobDatabase with a FakeDB.
+
+    Returns:
+        Tuple of (docopt mock, FakeDB).
+    """
+    mock_docopt, fake_db = MagicMock(), FakeDB()
+    monkeypatch.setattr(cli_module, 'docopt', mock_docopt)
+    monkeypatch.setattr('lib.job_database.JobDatabase', fake_db)
+    return mock_docopt, fake_db
 
 
 class TestSearchJobsCLI:
     """Test the search-jobs CLI command functionality."""
 
-    def test_search_jobs_basic_query(self):
-        """
-        Test basic job search with query term only.
-
-        Verifies that the search-jobs command properly calls the database
-        and displays results in the expected format.
-        """
-        # Mock database and search results
-        mock_jobs = [
+    @pytest.mark.parametrize('args_override,mock_return,header,expected_blocks,expected_search_kwargs', [
+        # Basic query: full single-job layout
+        (
+            {'<query>': 'python developer'},
+            ONE_JOB,
+            "=== Found 1 matching jobs ===",
+            [
+                {
+                    "Job ID: cli_test_1",
+                    "Title: Python Developer",
+                    "Company: TechCorp",
+                    "Work Type: Remote",
+                    "Location: San Francisco, CA",
+                    "Salary: $100K/yr - $120K/yr",
+                    "Parsed Salary: $100,000 - $120,000",
+                    "Status: active"
+                }
+            ],
+            {'query': 'python developer'}
+        ),
+        # All filters are parsed and passed through to the database
+        (
             {
-                'job_id': 'cli_test_1',
-                'title': 'Python Developer',
+                '<query>': 'senior engineer',
+                '--company': 'TechCorp',
+                '--location': 'remote',
+                '--work-type': 'Remote',
+                '--min-salary': '120000',
+                '--max-salary': '180000',
+                '--limit': '50'
+            },
+            [],
+            "=== Found 0 matching jobs ===",
+            [],
+            {
+                'query': 'senior engineer',
                 'company': 'TechCorp',
+                'location': 'remote',
                 'work_type': 'Remote',
-                'location': 'San Francisco, CA',
-                'salary': '$100K/yr - $120K/yr',
-                'salary_min_yearly': 100000,
-                'salary_max_yearly': 120000,
-                'status': 'active',
-                'first_seen': '2024-01-15 10:30:00',
-                'url': 'https://linkedin.com/jobs/view/cli_test_1'
+                'min_salary': 120000,
+                'max_salary': 180000,
+                'limit': 50
             }
-        ]
-
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                # Mock command arguments
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': 'python developer',
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': None,
-                    '--max-salary': None,
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
+        ),
+        # No results
+        (
+            {'<query>': 'nonexistent technology'},
+            [],
+            "=== Found 0 matching jobs ===",
+            [],
+            {'query': 'nonexistent technology'}
+        ),
+        # Multiple results, including jobs with optional fields missing
+        (
+            {'<query>': 'python OR data'},
+            TWO_JOBS,
+            "=== Found 2 matching jobs ===",
+            [
+                {
+                    "Job ID: multi_1",
+                    "Title: Senior Python Developer",
+                    "Work Type: Remote",
+                    "Salary: $130K/yr - $150K/yr"
+                },
+                {
+                    "Job ID: multi_2",
+                    "Title: Data Scientist",
+                    "Location: New York, NY"
                 }
-
-                # Mock database instance and search method
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.search_jobs.return_value = mock_jobs
-
-                # Capture stdout
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
-
-                # Verify database was called correctly
-                mock_db_instance.search_jobs.assert_called_once_with(
-                    query='python developer',
-                    company=None,
-                    location=None,
-                    work_type=None,
-                    min_salary=None,
-                    max_salary=None,
-                    limit=100
-                )
-
-                # Verify output format
-                output = mock_stdout.getvalue()
-                assert "=== Found 1 matching jobs ===" in output
-                assert "Job ID: cli_test_1" in output
-                assert "Title: Python Developer" in output
-                assert "Company: TechCorp" in output
-                assert "Work Type: Remote" in output
-                assert "Location: San Francisco, CA" in output
-                assert "Salary: $100K/yr - $120K/yr" in output
-                assert "Parsed Salary: $100,000 - $120,000" in output
-                assert "Status: active" in output
-
-    def test_search_jobs_all_filters(self):
+            ],
+            {'query': 'python OR data'}
+        ),
+    ], ids=['basic_query', 'all_filters', 'no_results', 'multiple_results'])
+    def test_search_jobs(self, mock_cli, capsys, args_override, mock_return,
+                         header, expected_blocks, expected_search_kwargs):
         """
-        Test job search with all filter parameters.
+        Test search-jobs argument handling and result display.
 
-        Verifies that all CLI filter options are properly parsed and
-        passed to the database search method.
+        Verifies that CLI filter options are parsed and passed to the
+        database search method, and that results are displayed in the
+        expected format.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                # Mock command arguments with all filters
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': 'senior engineer',
-                    '--company': 'TechCorp',
-                    '--location': 'remote',
-                    '--work-type': 'Remote',
-                    '--min-salary': '120000',
-                    '--max-salary': '180000',
-                    '--limit': '50',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
+        mock_docopt, fake_db = mock_cli
 
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.search_jobs.return_value = []
-
-                with patch('sys.stdout', new_callable=StringIO):
-                    main()
-
-                # Verify all parameters were passed correctly
-                mock_db_instance.search_jobs.assert_called_once_with(
-                    query='senior engineer',
-                    company='TechCorp',
-                    location='remote',
-                    work_type='Remote',
-                    min_salary=120000,
-                    max_salary=180000,
-                    limit=50
-                )
-
-    def test_search_jobs_salary_parsing_errors(self):
-        """
-        Test error handling for invalid salary values.
+        mock_docopt.return_value = docopt_args(BASE_SEARCH_ARGS, args_override)
+        fake_db.search_result = mock_return
 
-        Verifies that non-numeric salary values are properly handled
-        with appropriate error messages.
-        """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.sys.exit') as mock_exit:
-                # Test invalid min salary
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': None,
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': 'invalid',
-                    '--max-salary': None,
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
+        main()
 
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
-
-                # Should show error and exit
-                output = mock_stdout.getvalue()
-                assert "Error: --min-salary must be an integer" in output
-                mock_exit.assert_called_once_with(1)
-
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.sys.exit') as mock_exit:
-                # Test invalid max salary
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': None,
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': None,
-                    '--max-salary': 'also_invalid',
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
+        # Verify database was called correctly
+        assert fake_db.search_calls == [DEFAULT_SEARCH_KWARGS | expected_search_kwargs]
 
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
+        # Verify output format
+        output = capsys.readouterr().out
+        assert header in output
 
-                # Should show error and exit
-                output = mock_stdout.getvalue()
-                assert "Error: --max-salary must be an integer" in output
-                mock_exit.assert_called_once_with(1)
+        # Each job's expected lines must appear within that job's own block
+        blocks = split_job_blocks(output)
+        assert len(blocks) == len(mock_return)
+        for block, expected in zip(blocks, expected_blocks):
+            assert expected <= block, f"Missing from job block: {expected - block}"
 
-    def test_search_jobs_no_results(self):
+    @pytest.mark.parametrize('option,value', [
+        ('--min-salary', 'invalid'),
+        ('--max-salary', 'also_invalid'),
+    ])
+    def test_search_jobs_salary_parsing_errors(self, mock_cli, capsys, option, value):
         """
-        Test search results display when no jobs are found.
+        Test error handling for invalid salary values.
 
-        Verifies that empty search results are handled gracefully
-        with appropriate messaging.
+        Verifies that non-numeric salary values are properly handled
+        with appropriate error messages, before the database is opened.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': 'nonexistent technology',
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': None,
-                    '--max-salary': None,
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
+        mock_docopt, fake_db = mock_cli
 
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.search_jobs.return_value = []
+        mock_docopt.return_value = docopt_args(BASE_SEARCH_ARGS, {option: value})
 
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
+        with pytest.raises(SystemExit) as exc_info:
+            main()
 
-                output = mock_stdout.getvalue()
-                assert "=== Found 0 matching jobs ===" in output
+        # Should show error and exit
+        assert exc_info.value.code == 1
+        assert f"Error: {option} must be an integer" in capsys.readouterr().out
+        assert not fake_db.opened
 
-    def test_search_jobs_database_error(self):
+    def test_search_jobs_database_error(self, mock_cli, capsys):
         """
         Test error handling when database operations fail.
 
         Verifies that database connection errors and search failures
         are properly caught and reported.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                with patch('script.linkedin_auth.sys.exit') as mock_exit:
-                    mock_docopt.return_value = {
-                        'search-jobs': True,
-                        '<query>': 'test',
-                        '--company': None,
-                        '--location': None,
-                        '--work-type': None,
-                        '--min-salary': None,
-                        '--max-salary': None,
-                        '--limit': '100',
-                        'login': False,
-                        'db-stats': False,
-                        'decrypt-cookies': False
-                    }
-
-                    # Mock database creation failure
-                    mock_db_class.side_effect = Exception("Database connection failed")
-
-                    with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                        main()
-
-                    output = mock_stdout.getvalue()
-                    assert "Error searching jobs: Database connection failed" in output
-                    mock_exit.assert_called_once_with(1)
-
-    def test_search_jobs_multiple_results_formatting(self):
+        mock_docopt, fake_db = mock_cli
+
+        mock_docopt.return_value = docopt_args(BASE_SEARCH_ARGS, {'<query>': 'test'})
+
+        # Mock database creation failure
+        fake_db.open_error = Exception("Database connection failed")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Error searching jobs: Database connection failed" in output
+
+    def test_format_search_results_single_block(self):
         """
-        Test formatting of multiple search results.
+        Test that search results are rendered as one newline-terminated block.
 
-        Verifies that multiple job results are properly formatted
-        and separated in the output.
+        Verifies that optional fields are omitted when empty and that the
+        layout matches the line-per-field format.
         """
-        mock_jobs = [
+        jobs = [
             {
-                'job_id': 'multi_1',
-                'title': 'Senior Python Developer',
-                'company': 'TechCorp',
-                'work_type': 'Remote',
-                'location': 'Remote',
-                'salary': '$130K/yr - $150K/yr',
-                'salary_min_yearly': 130000,
-                'salary_max_yearly': 150000,
-                'status': 'active',
-                'first_seen': '2024-01-15 10:30:00',
-                'url': 'https://linkedin.com/jobs/view/multi_1'
-            },
-            {
-                'job_id': 'multi_2',
+                'job_id': 'fmt_1',
                 'title': 'Data Scientist',
                 'company': 'DataCorp',
-                'work_type': None,  # Test None work_type
+                'work_type': None,
                 'location': 'New York, NY',
-                'salary': None,  # Test None salary
+                'salary': None,
                 'salary_min_yearly': None,
                 'salary_max_yearly': None,
                 'status': 'active',
                 'first_seen': '2024-01-15 11:00:00',
-                'url': 'https://linkedin.com/jobs/view/multi_2'
+                'url': 'https://linkedin.com/jobs/view/fmt_1'
             }
         ]
 
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': 'python OR data',
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': None,
-                    '--max-salary': None,
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
-
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.search_jobs.return_value = mock_jobs
-
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
-
-                output = mock_stdout.getvalue()
-
-                # Should show correct count
-                assert "=== Found 2 matching jobs ===" in output
+        output = format_search_results(jobs)
+
+        assert output == (
+            "\n=== Found 1 matching jobs ===\n"
+            "\nJob ID: fmt_1\n"
+            "Title: Data Scientist\n"
+            "Company: DataCorp\n"
+            "Location: New York, NY\n"
+            "Status: active\n"
+            "First Seen: 2024-01-15 11:00:00\n"
+            "URL: https://linkedin.com/jobs/view/fmt_1\n"
+            + "-" * 50 + "\n"
+        )
+        assert format_search_results([]) == "\n=== Found 0 matching jobs ===\n"
+
+    def test_render_search_queries_database(self):
+        """
+        Test that render_search runs the query and formats its results.
 
-                # Should show both jobs
-                assert "Job ID: multi_1" in output
-                assert "Job ID: multi_2" in output
-                assert "Title: Senior Python Developer" in output
-                assert "Title: Data Scientist" in output
+        Verifies that the query and filters reach search_jobs() unchanged
+        and that the output matches format_search_results().
+        """
+        fake_db = FakeDB()
+        fake_db.search_result = ONE_JOB
 
-                # Should handle optional fields correctly
-                assert "Work Type: Remote" in output  # First job has work_type
-                # Second job should not show work_type line since it's None
+        output = render_search(fake_db, 'Python', company='TechCorp', limit=10)
 
-                assert "$130K/yr - $150K/yr" in output  # First job has salary
-                # Second job should not show salary lines since it's None
+        assert fake_db.search_calls == [{'query': 'Python', 'company': 'TechCorp', 'limit': 10}]
+        assert output == format_search_results(ONE_JOB)
 
 
 class TestDbStatsCLI:
     """Test the db-stats CLI command functionality."""
 
-    def test_db_stats_complete_display(self):
+    def test_db_stats_complete_display(self, mock_cli, capsys):
         """
         Test complete database statistics display.
 
         Verifies that all database statistics are properly formatted
         and displayed in the expected structure.
         """
+        mock_docopt, fake_db = mock_cli
+
         mock_stats = {
             'total_jobs': 150,
             'active_jobs': 120,
@@ -374,60 +444,57 @@ class TestDbStatsCLI:
             }
         }
 
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': False,
-                    'db-stats': True,
-                    'login': False,
-                    'decrypt-cookies': False
-                }
+        mock_docopt.return_value = BASE_STATS_ARGS
+
+        fake_db.stats = mock_stats
+
+        main()
+
+        output = capsys.readouterr().out
+
+        # Each expected entry must appear as a whole output line
+        expected_lines = {
+            # Verify main statistics section
+            "=== Database Statistics ===",
+            "Total Jobs: 150",
+            "Active Jobs: 120",
+            "Jobs Seen (Last 7 days): 25",
+            "Total Scrape Sessions: 10",
+
+            # Verify jobs by status section
+            "Jobs by Status:",
+            "  active: 120",
+            "  removed: 20",
+            "  applied: 8",
+            "  rejected: 2",
+
+            # Verify work types section
+            "Work Types:",
+            "  Remote: 45",
+            "  Hybrid: 30",
+            "  On-site: 25",
+            "  Unknown: 20",
+
+            # Verify top companies section
+            "Top Companies:",
+            "  TechCorp: 15",
+            "  DataCorp: 12",
+            "  WebCorp: 10",
+            "  CloudCorp: 8",
+            "  StartupCorp: 5"
+        }
+        missing = expected_lines - set(output.splitlines())
+        assert not missing, missing
 
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.get_stats.return_value = mock_stats
-
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
-
-                output = mock_stdout.getvalue()
-
-                # Verify main statistics section
-                assert "=== Database Statistics ===" in output
-                assert "Total Jobs: 150" in output
-                assert "Active Jobs: 120" in output
-                assert "Jobs Seen (Last 7 days): 25" in output
-                assert "Total Scrape Sessions: 10" in output
-
-                # Verify jobs by status section
-                assert "Jobs by Status:" in output
-                assert "  active: 120" in output
-                assert "  removed: 20" in output
-                assert "  applied: 8" in output
-                assert "  rejected: 2" in output
-
-                # Verify work types section
-                assert "Work Types:" in output
-                assert "  Remote: 45" in output
-                assert "  Hybrid: 30" in output
-                assert "  On-site: 25" in output
-                assert "  Unknown: 20" in output
-
-                # Verify top companies section
-                assert "Top Companies:" in output
-                assert "  TechCorp: 15" in output
-                assert "  DataCorp: 12" in output
-                assert "  WebCorp: 10" in output
-                assert "  CloudCorp: 8" in output
-                assert "  StartupCorp: 5" in output
-
-    def test_db_stats_empty_database(self):
+    def test_db_stats_empty_database(self, mock_cli, capsys):
         """
         Test database statistics display with empty database.
 
         Verifies that empty statistics are handled gracefully
         without errors or malformed output.
         """
+        mock_docopt, fake_db = mock_cli
+
         mock_empty_stats = {
             'total_jobs': 0,
             'active_jobs': 0,
@@ -438,97 +505,80 @@ class TestDbStatsCLI:
             'top_companies': {}
         }
 
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': False,
-                    'db-stats': True,
-                    'login': False,
-                    'decrypt-cookies': False
-                }
+        mock_docopt.return_value = BASE_STATS_ARGS
 
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.get_stats.return_value = mock_empty_stats
+        fake_db.stats = mock_empty_stats
 
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
+        main()
 
-                output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
 
-                # Should show zero counts
-                assert "Total Jobs: 0" in output
-                assert "Active Jobs: 0" in output
-                assert "Jobs Seen (Last 7 days): 0" in output
-                assert "Total Scrape Sessions: 0" in output
+        # Each expected entry must appear as a whole output line
+        expected_lines = {
+            # Should show zero counts
+            "Total Jobs: 0",
+            "Active Jobs: 0",
+            "Jobs Seen (Last 7 days): 0",
+            "Total Scrape Sessions: 0",
 
-                # Should show section headers even when empty
-                assert "Jobs by Status:" in output
-                assert "Work Types:" in output
-                assert "Top Companies:" in output
+            # Should show section headers even when empty
+            "Jobs by Status:",
+            "Work Types:",
+            "Top Companies:"
+        }
+        missing = expected_lines - set(output.splitlines())
+        assert not missing, missing
 
-    def test_db_stats_database_error(self):
+    def test_db_stats_database_error(self, mock_cli, capsys):
         """
         Test error handling when database statistics retrieval fails.
 
         Verifies that database errors are properly caught and reported
         with appropriate exit codes.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                with patch('script.linkedin_auth.sys.exit') as mock_exit:
-                    mock_docopt.return_value = {
-                        'search-jobs': False,
-                        'db-stats': True,
-                        'login': False,
-                        'decrypt-cookies': False
-                    }
-
-                    # Mock database statistics failure
-                    mock_db_instance = MagicMock()
-                    mock_db_class.return_value = mock_db_instance
-                    mock_db_instance.get_stats.side_effect = Exception("Database query failed")
-
-                    with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                        main()
-
-                    output = mock_stdout.getvalue()
-                    assert "Error getting database stats: Database query failed" in output
-                    mock_exit.assert_called_once_with(1)
-
-    def test_db_stats_database_creation_error(self):
+        mock_docopt, fake_db = mock_cli
+
+        mock_docopt.return_value = BASE_STATS_ARGS
+
+        # Mock database statistics failure
+        fake_db.query_error = Exception("Database query failed")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Error getting database stats: Database query failed" in output
+
+    def test_db_stats_database_creation_error(self, mock_cli, capsys):
         """
         Test error handling when database creation fails.
 
         Verifies that database initialization errors are handled properly.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                with patch('script.linkedin_auth.sys.exit') as mock_exit:
-                    mock_docopt.return_value = {
-                        'search-jobs': False,
-                        'db-stats': True,
-                        'login': False,
-                        'decrypt-cookies': False
-                    }
-
-                    # Mock database creation failure
-                    mock_db_class.side_effect = Exception("Cannot access database file")
-
-                    with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                        main()
-
-                    output = mock_stdout.getvalue()
-                    assert "Error getting database stats: Cannot access database file" in output
-                    mock_exit.assert_called_once_with(1)
-
-    def test_db_stats_partial_data(self):
+        mock_docopt, fake_db = mock_cli
+
+        mock_docopt.return_value = BASE_STATS_ARGS
+
+        # Mock database creation failure
+        fake_db.open_error = Exception("Cannot access database file")
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Error getting database stats: Cannot access database file" in output
+
+    def test_db_stats_partial_data(self, mock_cli, capsys):
         """
         Test database statistics display with partial/missing data.
 
         Verifies that missing or incomplete statistics sections
         are handled gracefully without errors.
         """
+        mock_docopt, fake_db = mock_cli
+
         mock_partial_stats = {
             'total_jobs': 50,
             'active_jobs': 45,
@@ -547,38 +597,63 @@ class TestDbStatsCLI:
             }
         }
 
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': False,
-                    'db-stats': True,
-                    'login': False,
-                    'decrypt-cookies': False
-                }
+        mock_docopt.return_value = BASE_STATS_ARGS
 
-                mock_db_instance = MagicMock()
-                mock_db_class.return_value = mock_db_instance
-                mock_db_instance.get_stats.return_value = mock_partial_stats
+        fake_db.stats = mock_partial_stats
 
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
+        main()
 
-                output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
 
-                # Should display available data correctly
-                assert "Total Jobs: 50" in output
-                assert "Active Jobs: 45" in output
+        # Each expected entry must appear as a whole output line
+        expected_lines = {
+            # Should display available data correctly
+            "Total Jobs: 50",
+            "Active Jobs: 45",
 
-                # Should show only available status types
-                assert "  active: 45" in output
-                assert "  removed: 5" in output
+            # Should show only available status types
+            "  active: 45",
+            "  removed: 5",
 
-                # Should show only available work types
-                assert "  Remote: 25" in output
-                assert "  Unknown: 20" in output
+            # Should show only available work types
+            "  Remote: 25",
+            "  Unknown: 20",
 
-                # Should show single company
-                assert "  SingleCorp: 50" in output
+            # Should show single company
+            "  SingleCorp: 50"
+        }
+        missing = expected_lines - set(output.splitlines())
+        assert not missing, missing
+
+    def test_format_stats_single_block(self):
+        """
+        Test that database statistics are rendered as one newline-terminated block.
+
+        Verifies section ordering and that empty sections keep their headers.
+        """
+        stats = {
+            'total_jobs': 3,
+            'active_jobs': 2,
+            'jobs_seen_last_7_days': 1,
+            'total_sessions': 1,
+            'jobs_by_status': {'active': 2, 'removed': 1},
+            'work_types': {},
+            'top_companies': {'TechCorp': 3}
+        }
+
+        assert format_stats(stats) == (
+            "\n=== Database Statistics ===\n"
+            "Total Jobs: 3\n"
+            "Active Jobs: 2\n"
+            "Jobs Seen (Last 7 days): 1\n"
+            "Total Scrape Sessions: 1\n"
+            "\nJobs by Status:\n"
+            "  active: 2\n"
+            "  removed: 1\n"
+            "\nWork Types:\n"
+            "\nTop Companies:\n"
+            "  TechCorp: 3\n"
+        )
 
 
 class TestCLIIntegration:
@@ -590,15 +665,23 @@ class TestCLIIntegration:
 
         Verifies that the docopt version parameter works correctly.
         """
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            # Mock version request
-            mock_docopt.return_value = {'--version': True}
+        with patch.object(cli_module, 'docopt') as mock_docopt:
+            # Mock version request (no command selected)
+            mock_docopt.return_value = {
+                'login': False,
+                'scrape-jobs': False,
+                'search-jobs': False,
+                'db-stats': False,
+                'decrypt-cookies': False,
+                '--version': True
+            }
 
             # The docopt version should be called with version parameter
             main()
 
             mock_docopt.assert_called_once_with(
-                patch.ANY,  # The docstring
+                cli_module.__doc__,
+                argv=None,
                 version="LinkedIn Auth 1.0"
             )
 
@@ -612,34 +695,35 @@ class TestCLIIntegration:
         # This test verifies the actual command precedence in the CLI
         # The real CLI should handle precedence through docopt configuration
 
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.LinkedInSession') as mock_session_class:
-                # Mock scenario where multiple commands might be true
-                # (This shouldn't happen with proper docopt usage, but tests edge cases)
-                mock_docopt.return_value = {
-                    'login': True,
-                    'search-jobs': False,  # Should be handled first due to elif structure
-                    'db-stats': False,
-                    'decrypt-cookies': False,
-                    # Login-specific arguments
-                    '--force-fresh-login': False,
-                    '--headless': False,
-                    '--with-descriptions': False,
-                    '--max-descriptions': '5',
-                    '--no-database': False,
-                    '<filename>': None
-                }
+        with ExitStack() as stack:
+            mock_docopt = stack.enter_context(patch.object(cli_module, 'docopt'))
+            mock_session_class = stack.enter_context(patch('lib.linkedin_session.LinkedInSession'))
+            stack.enter_context(patch.dict('os.environ', {'TESTING': '1'}))  # Skip input prompt
+
+            # Mock scenario where multiple commands might be true
+            # (This shouldn't happen with proper docopt usage, but tests edge cases)
+            mock_docopt.return_value = {
+                'login': True,
+                'search-jobs': False,  # Should be handled first due to elif structure
+                'db-stats': False,
+                'decrypt-cookies': False,
+                # Login-specific arguments
+                '--force-fresh-login': False,
+                '--headless': False,
+                '--with-descriptions': False,
+                '--max-descriptions': '5',
+                '--no-database': False,
+                '<filename>': None
+            }
 
-                mock_session = MagicMock()
-                mock_session_class.return_value = mock_session
-                mock_session.login.return_value = True
+            mock_session = MagicMock()
+            mock_session_class.return_value = mock_session
+            mock_session.login.return_value = True
 
-                with patch('sys.stdout', new_callable=StringIO):
-                    with patch.dict('os.environ', {'TESTING': '1'}):  # Skip input prompt
-                        main()
+            main()
 
-                # Should execute login command (first in elif chain)
-                mock_session.login.assert_called_once()
+        # Should execute login command (first in elif chain)
+        mock_session.login.assert_called_once()
 
     def test_cli_help_documentation_completeness(self):
         """
@@ -651,28 +735,5 @@ class TestCLIIntegration:
         # Import the docstring from the script
         from script.linkedin_auth import __doc__ as cli_doc
 
-        # Verify all commands are documented
-        assert 'search-jobs' in cli_doc
-        assert 'db-stats' in cli_doc
-        assert 'login' in cli_doc
-        assert 'decrypt-cookies' in cli_doc
-
-        # Verify search-jobs options are documented
-        assert '--company' in cli_doc
-        assert '--location' in cli_doc
-        assert '--work-type' in cli_doc
-        assert '--min-salary' in cli_doc
-        assert '--max-salary' in cli_doc
-        assert '--limit' in cli_doc
-
-        # Verify login options are documented
-        assert '--force-fresh-login' in cli_doc
-        assert '--headless' in cli_doc
-        assert '--with-descriptions' in cli_doc
-        assert '--max-descriptions' in cli_doc
-        assert '--no-database' in cli_doc
-
-        # Verify examples are provided
-        assert 'Examples:' in cli_doc
-        assert 'linkedin_auth.py search-jobs' in cli_doc
-        assert 'linkedin_auth.py db-stats' in cli_doc
\ No newline at end of file
+        missing = {token for token in REQUIRED_DOC_TOKENS if token not in cli_doc}
+        assert not missing, f"CLI doc missing tokens: {missing}"
@@ -5,100 +5,115 @@ These tests cover edge cases, invalid command combinations,
 and malformed command-line arguments to ensure robust error handling.
 """
 
+import subprocess
 import sys
+from pathlib import Path
+
 import pytest
-from unittest.mock import patch
 from docopt import DocoptExit
 
-# Add the project root to the path for imports
-sys.path.insert(0, '.')
+# The project root is put on sys.path by pytest.ini (pythonpath = .)
 import script.linkedin_auth as cli_module
 from script.linkedin_auth import main
 
+# Usage docstring that every docopt call in this module parses
+DOC = cli_module.__doc__
+
+
+# Invocations docopt must reject outright
+INVALID_ARGV = (
+    pytest.param(['invalid'], id='invalid_command'),
+    pytest.param([], id='no_command'),
+    pytest.param(['--headless'], id='bare_flag'),
+    pytest.param(['login', '--unknown-flag'], id='unknown_flag'),
+    pytest.param(['login', 'extra', 'arguments'], id='extra_args'),
+    pytest.param(['decrypt-cookies', '--headless'], id='decrypt_with_login_flag'),
+    pytest.param([''], id='empty_string'),
+)
+
+# Argument combinations the docopt usage pattern itself must reject
+DOCOPT_EDGE_CASES = (
+    [],  # No arguments
+    ['invalid-command'],  # Invalid command
+    ['login', 'extra'],  # Extra arguments
+    ['--headless'],  # Flag without command
+    ['login', '--invalid-flag'],  # Invalid flag
+    ['decrypt-cookies', '--force-fresh-login'],  # Wrong flag for command
+    ['login', '--headless', '--windowed'],  # Mutually exclusive flags
+)
+
+# Commands must match the docstring's lowercase spelling
+CASE_SENSITIVITY_ARGS = (
+    ['LOGIN'],  # Uppercase command
+    ['Login'],  # Mixed case command
+    ['DECRYPT-COOKIES'],  # Uppercase command
+)
+
+# Flags must match the docstring's spelling exactly
+FLAG_VARIATION_ARGS = (
+    ['login', '--force_fresh_login'],  # Underscore instead of dash
+    ['login', '--headless=true'],  # Equals sign not supported
+    ['login', '--HEADLESS'],  # Uppercase flag
+)
+
+SPECIAL_CHARACTER_ARGS = (
+    ['login@special'],
+    ['login!'],
+    ['login#test'],
+    ['login$'],
+)
+
+
+def _argv_id(argv):
+    """Readable pytest id for an argv list."""
+    return '+'.join(argv) or 'no_args'
+
 
 class TestLinkedInAuthCLIInvalid:
     """Test invalid CLI invocations and error handling."""
     
-    def test_cli_invalid_command(self):
-        """
-        Test handling of invalid command arguments.
-        
-        This test verifies that invalid commands like 'invalid' are
-        properly rejected with appropriate error messages.
+    @pytest.mark.parametrize('argv', INVALID_ARGV)
+    def test_cli_rejects_invalid(self, argv):
         """
-        test_args = ['linkedin_auth.py', 'invalid']
+        Test that malformed invocations are rejected.
         
-        with patch('sys.argv', test_args):
-            # docopt should raise DocoptExit for invalid commands
-            with pytest.raises(SystemExit):
-                main()
-    
-    def test_cli_no_command(self):
-        """
-        Test handling when no command is provided.
-        
-        This test verifies that running the script without any command
-        displays usage information and exits appropriately.
-        """
-        test_args = ['linkedin_auth.py']
-        
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
-    
-    def test_cli_invalid_flag_combination(self):
+        This test verifies that unknown commands, missing commands,
+        unknown or misplaced flags, extra arguments and empty strings
+        all make main() exit through docopt.
         """
-        Test handling of flags without required command.
-        
-        This test verifies that providing flags without a valid command
-        results in appropriate error handling.
-        """
-        test_args = ['linkedin_auth.py', '--headless']  # Flag without command
-        
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
+        with pytest.raises(SystemExit):
+            main(argv)
     
-    def test_cli_unknown_flag(self):
+    def test_cli_reads_sys_argv_by_default(self, monkeypatch):
         """
-        Test handling of unknown/unsupported flags.
+        Test that main() falls back to sys.argv when no argv is given.
         
-        This test verifies that unknown flags are rejected with
-        appropriate error messages from docopt.
+        This test verifies the default path used by the console entry
+        point still rejects an invalid command.
         """
-        test_args = ['linkedin_auth.py', 'login', '--unknown-flag']
+        monkeypatch.setattr(sys, 'argv', ['linkedin_auth.py', 'invalid'])
         
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
+        with pytest.raises(SystemExit):
+            main()
     
-    def test_cli_extra_arguments(self):
+    def test_cli_invalid_number_fails_before_browser_start(self, session_class, capsys):
         """
-        Test handling of unexpected extra arguments.
+        Test that non-integer numeric options are rejected up front.
         
-        This test verifies that extra arguments beyond what's defined
-        in the docstring are properly rejected.
+        This test verifies that a bad --max-descriptions value exits
+        before LinkedInSession (and Chrome) is ever constructed.
         """
-        test_args = ['linkedin_auth.py', 'login', 'extra', 'arguments']
+        test_args = ['scrape-jobs', '--max-descriptions=many']
         
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
-    
-    def test_cli_decrypt_with_flags(self):
-        """
-        Test that decrypt-cookies command rejects login-specific flags.
-        
-        This test verifies that flags specific to the login command
-        are not accepted with the decrypt-cookies command.
-        """
-        test_args = ['linkedin_auth.py', 'decrypt-cookies', '--headless']
+        with pytest.raises(SystemExit) as exc_info:
+            main(test_args)
         
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
+        assert exc_info.value.code == 1
+        session_class.assert_not_called()
+        assert "Error: --max-descriptions must be an integer" in capsys.readouterr().out
     
-    def test_docopt_parsing_edge_cases(self):
+    @pytest.mark.parametrize('invalid_args', DOCOPT_EDGE_CASES, ids=_argv_id)
+    def test_docopt_parsing_edge_cases(self, invalid_args):
         """
         Test edge cases in docopt argument parsing.
         
@@ -107,98 +122,55 @@ class TestLinkedInAuthCLIInvalid:
         """
         from docopt import docopt
         
-        # Test cases that should raise DocoptExit
-        invalid_cases = [
-            [],  # No arguments
-            ['invalid-command'],  # Invalid command
-            ['login', 'extra'],  # Extra arguments
-            ['--headless'],  # Flag without command
-            ['login', '--invalid-flag'],  # Invalid flag
-            ['decrypt-cookies', '--force-fresh-login'],  # Wrong flag for command
-        ]
-        
-        for invalid_args in invalid_cases:
-            with pytest.raises(DocoptExit):
-                docopt(cli_module.__doc__, argv=invalid_args, version="LinkedIn Auth 1.0")
+        with pytest.raises(DocoptExit):
+            docopt(DOC, argv=invalid_args, version=cli_module.VERSION)
     
-    def test_cli_case_sensitivity(self):
+    @pytest.mark.parametrize('test_args', CASE_SENSITIVITY_ARGS, ids=_argv_id)
+    def test_cli_case_sensitivity(self, test_args):
         """
         Test that commands are case-sensitive.
         
         This test verifies that commands must be in the exact case
         as specified in the docstring (lowercase).
         """
-        test_cases = [
-            ['LOGIN'],  # Uppercase command
-            ['Login'],  # Mixed case command  
-            ['DECRYPT-COOKIES'],  # Uppercase command
-        ]
-        
-        for test_args in test_cases:
-            full_args = ['linkedin_auth.py'] + test_args
-            with patch('sys.argv', full_args):
-                with pytest.raises(SystemExit):
-                    main()
+        with pytest.raises(SystemExit):
+            main(test_args)
     
-    def test_cli_flag_variations(self):
+    @pytest.mark.parametrize('test_args', FLAG_VARIATION_ARGS, ids=_argv_id)
+    def test_cli_flag_variations(self, test_args):
         """
         Test various flag format variations.
         
         This test verifies that flags must be in the exact format
         specified and that variations are rejected.
         """
-        invalid_flag_cases = [
-            ['login', '-h'],  # Should be --help
-            ['login', '--force_fresh_login'],  # Underscore instead of dash
-            ['login', '--headless=true'],  # Equals sign not supported
-            ['login', '--HEADLESS'],  # Uppercase flag
-        ]
-        
-        for test_args in invalid_flag_cases:
-            full_args = ['linkedin_auth.py'] + test_args
-            with patch('sys.argv', full_args):
-                # Some of these might not raise SystemExit (like -h), 
-                # so we catch both possible outcomes
-                try:
-                    main()
-                except SystemExit:
-                    pass  # Expected for invalid arguments
-                except Exception as e:
-                    # Verify it's an argument parsing related error
-                    assert 'argument' in str(e).lower() or 'option' in str(e).lower()
+        with pytest.raises(DocoptExit):
+            main(test_args)
     
-    def test_cli_empty_string_arguments(self):
+    def test_cli_short_help_after_command(self, capsys):
         """
-        Test handling of empty string arguments.
+        Test that -h after a command prints help rather than a usage error.
         
-        This test verifies that empty strings in arguments are
-        properly handled or rejected.
+        This test verifies a clean help exit: a plain SystemExit (not its
+        DocoptExit subclass) with no error code, and the usage text on stdout.
         """
-        test_args = ['linkedin_auth.py', '']
+        with pytest.raises(SystemExit) as exc_info:
+            main(['login', '-h'])
         
-        with patch('sys.argv', test_args):
-            with pytest.raises(SystemExit):
-                main()
+        assert exc_info.type is SystemExit
+        assert exc_info.value.code in (None, 0)
+        assert "Usage:" in capsys.readouterr().out
     
-    def test_cli_special_characters(self):
+    @pytest.mark.parametrize('test_args', SPECIAL_CHARACTER_ARGS, ids=_argv_id)
+    def test_cli_special_characters(self, test_args):
         """
         Test handling of special characters in arguments.
         
         This test verifies that arguments containing special characters
         are properly handled by the argument parser.
         """
-        special_char_cases = [
-            ['login@special'],
-            ['login!'],
-            ['login#test'],
-            ['login$'],
-        ]
-        
-        for test_args in special_char_cases:
-            full_args = ['linkedin_auth.py'] + test_args
-            with patch('sys.argv', full_args):
-                with pytest.raises(SystemExit):
-                    main()
+        with pytest.raises(SystemExit):
+            main(test_args)
     
     def test_docopt_version_format(self):
         """
@@ -213,7 +185,7 @@ class TestLinkedInAuthCLIInvalid:
         test_args = ['--version']
         
         with pytest.raises(SystemExit):
-            docopt(cli_module.__doc__, argv=test_args, version="LinkedIn Auth 1.0")
+            docopt(DOC, argv=test_args, version=cli_module.VERSION)
     
     def test_docopt_help_content(self):
         """
@@ -227,4 +199,27 @@ class TestLinkedInAuthCLIInvalid:
         test_args = ['--help']
         
         with pytest.raises(SystemExit):
-            docopt(cli_module.__doc__, argv=test_args, version="LinkedIn Auth 1.0")
\ No newline at end of file
+            docopt(DOC, argv=test_args, version=cli_module.VERSION)
+    
+    def test_help_skips_heavy_imports(self):
+        """
+        Test that --help is answered without the browser stack.
+        
+        This test runs the script with -X importtime in a fresh interpreter
+        and verifies that selenium, cryptography and orjson are not imported,
+        catching any heavy import moved back to module scope.
+        """
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-m', 'script.linkedin_auth', '--help'],
+            capture_output=True, text=True, timeout=30,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        
+        assert proc.returncode == 0, proc.stderr
+        assert "Usage:" in proc.stdout
+        
+        # importtime lines end with "| <indented module name>"
+        imported = {line.rsplit('|', 1)[-1].strip().split('.')[0]
+                    for line in proc.stderr.splitlines()
+                    if line.startswith('import time:')}
+        assert not imported & {'selenium', 'cryptography', 'orjson'}, sorted(imported)
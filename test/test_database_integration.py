@@ -6,10 +6,8 @@ job description extraction, database storage, and CLI interactions.
 Following TDD principles for comprehensive workflow validation.
 """
 
-import tempfile
 import sqlite3
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import List, Dict, Any
 from unittest.mock import patch, MagicMock, call
 import json
@@ -20,30 +18,98 @@ sys.path.insert(0, '.')
 
 from lib.linkedin_session import LinkedInSession
 from lib.job_database import JobDatabase, JobRecord, ScrapeSession
+from script.linkedin_auth import render_search, render_stats
+
+
+# Value pools cycled through by the generated performance dataset
+COMPANIES = tuple(f'Company_{i}' for i in range(10))
+WORK_TYPES = ('Remote', 'Hybrid', 'On-site')
+CITIES = tuple(f'City_{i}, State' for i in range(5))
+
+
+@pytest.fixture(scope="module", params=[50, 500])
+def large_job_dataset(request):
+    """Generated scrape results, cycling through 10 companies and 5 cities."""
+    return [
+        {
+            'job_id': f'perf_test_job_{i:03d}',
+            'title': f'Software Engineer {i}',
+            'company': COMPANIES[i % 10],
+            'work_type': WORK_TYPES[i % 3],
+            'location': CITIES[i % 5],
+            'salary': f'${90 + i}K/yr - ${120 + i}K/yr',
+            'benefits': 'Standard benefits package',
+            'url': f'https://www.linkedin.com/jobs/view/perf_test_job_{i:03d}',
+            'description': None
+        }
+        for i in range(request.param)
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cookie_encryption_key():
+    """Set COOKIE_ENCRYPTION_KEY once for every session built in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('COOKIE_ENCRYPTION_KEY', 'rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs=')
+        yield
+
+
+@pytest.fixture(scope="module")
+def temp_database(tmp_path_factory):
+    """Create one temporary database per module; the schema is built once."""
+    db_path = tmp_path_factory.mktemp("db") / "integration_test.db"
+    return JobDatabase(db_path=db_path)
+
+
+@pytest.fixture(scope="class")
+def mock_linkedin_session(temp_database):
+    """Create a LinkedIn session with mocked browser and real database, once per test class."""
+    with patch('lib.linkedin_session.load_dotenv'):
+        with patch('lib.linkedin_session.Path.mkdir'):
+            session = LinkedInSession(headless=True)
+            session.driver = MagicMock()
+            session.db = temp_database
+            yield session
+
+
+def delete_all_rows(db_path):
+    """Empty every table in one transaction (the FTS delete trigger clears jobs_fts)."""
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript("""
+            BEGIN;
+            DELETE FROM job_session_mapping;
+            DELETE FROM scrape_sessions;
+            DELETE FROM jobs;
+            COMMIT;
+        """)
+
+
+# Job IDs of the sample scrape used by TestCompleteWorkflowIntegration
+JOB_IDS = ('integration_job_1', 'integration_job_2', 'integration_job_3')
+
+
+def fetch_jobs(db_path, job_ids, columns):
+    """Read columns for job_ids with a single SELECT; returns {job_id: row dict}."""
+    placeholders = ','.join('?' * len(job_ids))
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            f"SELECT job_id, {', '.join(columns)} FROM jobs WHERE job_id IN ({placeholders})",
+            list(job_ids)
+        )
+        return {row['job_id']: dict(row) for row in rows}
 
 
-class TestCompleteWorkflowIntegration:
-    """Test complete workflow from scraping to database storage."""
+@pytest.fixture(autouse=True)
+def clean_database(temp_database):
+    """Delete all rows before each test."""
+    delete_all_rows(temp_database.db_path)
 
-    @pytest.fixture
-    def temp_database(self):
-        """Create a temporary database for integration testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "integration_test.db"
-            yield JobDatabase(db_path=db_path)
 
-    @pytest.fixture
-    def mock_linkedin_session(self, temp_database):
-        """Create a LinkedIn session with mocked browser and real database."""
-        with patch('lib.linkedin_session.load_dotenv'):
-            with patch('lib.linkedin_session.Path.mkdir'):
-                with patch.dict('os.environ', {'COOKIE_ENCRYPTION_KEY': 'rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs='}):
-                    session = LinkedInSession(headless=True)
-                    session.driver = MagicMock()
-                    session.db = temp_database
-                    yield session
+class TestCompleteWorkflowIntegration:
+    """Test complete workflow from scraping to database storage."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_linkedin_job_data(self):
         """Sample job data as would be scraped from LinkedIn DOM."""
         return [
@@ -82,67 +148,97 @@ class TestCompleteWorkflowIntegration:
             }
         ]
 
-    def test_complete_scraping_workflow_without_descriptions(self, mock_linkedin_session, sample_linkedin_job_data):
+    @pytest.fixture(scope="class")
+    def initial_scrape_snapshot(self, mock_linkedin_session, sample_linkedin_job_data, temp_database):
         """
-        Test complete job scraping workflow without description extraction.
+        Run the first scrape of the sample jobs once for the class.
 
-        Verifies that jobs are properly scraped, stored in database,
-        and linked to scrape sessions for audit trail.
+        Returns an in-memory copy of the resulting database together with
+        the scrape result, so tests can restore that state cheaply.
         """
         session = mock_linkedin_session
+        delete_all_rows(temp_database.db_path)
 
-        # Mock the scraping method
         with patch.object(session, '_scrape_job_listings') as mock_scrape:
             mock_scrape.return_value = sample_linkedin_job_data
-
-            # Perform the scraping workflow
-            result = session.scrape_jobs_to_database(
+            first_result = session.scrape_jobs_to_database(
                 search_terms="python developer",
                 location="remote"
             )
 
-            # Verify workflow completed successfully
-            assert result is not None
-            assert 'session_id' in result
-            assert 'jobs_processed' in result
-            assert 'new_jobs' in result
-            assert result['jobs_processed'] == 3
-            assert result['new_jobs'] == 3
-
-            # Verify jobs were stored in database
-            for job_data in sample_linkedin_job_data:
-                stored_job = session.db.get_job(job_data['job_id'])
-                assert stored_job is not None
-                assert stored_job['title'] == job_data['title']
-                assert stored_job['company'] == job_data['company']
-                assert stored_job['salary'] == job_data['salary']
-                assert stored_job['status'] == 'active'
-                assert stored_job['source'] == 'linkedin'
-
-            # Verify generated salary columns were computed
-            job1 = session.db.get_job('integration_job_1')
-            assert job1['salary_min_yearly'] == 120000
-            assert job1['salary_max_yearly'] == 150000
-
-            # Verify scrape session was created
-            session_id = result['session_id']
-            with sqlite3.connect(session.db.db_path) as conn:
-                session_data = conn.execute(
-                    "SELECT * FROM scrape_sessions WHERE session_id = ?",
-                    (session_id,)
-                ).fetchone()
-                assert session_data is not None
-                assert session_data[2] == 3  # total_jobs_found
-                assert session_data[3] == 3  # new_jobs_added
-
-            # Verify job-session mappings were created
-            with sqlite3.connect(session.db.db_path) as conn:
-                mappings = conn.execute(
-                    "SELECT * FROM job_session_mapping WHERE session_id = ?",
-                    (session_id,)
-                ).fetchall()
-                assert len(mappings) == 3
+        snapshot = sqlite3.connect(':memory:')
+        with sqlite3.connect(temp_database.db_path) as conn:
+            conn.backup(snapshot)
+        yield snapshot, first_result
+        snapshot.close()
+
+    @pytest.fixture
+    def initial_scrape(self, initial_scrape_snapshot, mock_linkedin_session, temp_database):
+        """Restore the post-first-scrape database and return (session, first_result)."""
+        snapshot, first_result = initial_scrape_snapshot
+        with sqlite3.connect(temp_database.db_path) as conn:
+            snapshot.backup(conn)
+        return mock_linkedin_session, first_result
+
+    def test_complete_scraping_workflow_without_descriptions(self, initial_scrape, sample_linkedin_job_data):
+        """
+        Test complete job scraping workflow without description extraction.
 
+        Verifies that jobs are properly scraped, stored in database,
+        and linked to scrape sessions for audit trail.
+        """
+        session, result = initial_scrape
+
+        # Verify workflow completed successfully
+        assert result is not None
+        assert 'session_id' in result
+        assert 'jobs_processed' in result
+        assert 'new_jobs' in result
+        assert result['jobs_processed'] == 3
+        assert result['new_jobs'] == 3
+
+        # Verify jobs, the scrape session and its job mappings
+        job_ids = [job_data['job_id'] for job_data in sample_linkedin_job_data]
+        stored_jobs = fetch_jobs(
+            session.db.db_path, job_ids,
+            ['title', 'company', 'salary', 'status', 'source',
+             'salary_min_yearly', 'salary_max_yearly']
+        )
+        session_id = result['session_id']
+        with sqlite3.connect(session.db.db_path) as conn:
+            session_data = conn.execute(
+                "SELECT * FROM scrape_sessions WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+            mappings = conn.execute(
+                "SELECT * FROM job_session_mapping WHERE session_id = ?",
+                (session_id,)
+            ).fetchall()
+
+        # Verify jobs were stored in database
+        assert set(stored_jobs) == set(job_ids)
+        for job_data in sample_linkedin_job_data:
+            stored_job = stored_jobs[job_data['job_id']]
+            assert stored_job['title'] == job_data['title']
+            assert stored_job['company'] == job_data['company']
+            assert stored_job['salary'] == job_data['salary']
+            assert stored_job['status'] == 'active'
+            assert stored_job['source'] == 'linkedin'
+
+        # Verify generated salary columns were computed
+        job1 = stored_jobs['integration_job_1']
+        assert job1['salary_min_yearly'] == 120000
+        assert job1['salary_max_yearly'] == 150000
+
+        # Verify scrape session was created
+        assert session_data is not None
+        assert session_data[2] == 3  # total_jobs_found
+        assert session_data[3] == 3  # new_jobs_added
+
+        # Verify job-session mappings were created
+        assert len(mappings) == 3
+
+    @pytest.mark.fts
     def test_complete_scraping_workflow_with_descriptions(self, mock_linkedin_session, sample_linkedin_job_data):
         """
         Test complete job scraping workflow with description extraction.
@@ -180,9 +276,9 @@ class TestCompleteWorkflowIntegration:
                 assert mock_extract.call_count == 3
 
                 # Verify descriptions were stored
-                for i, job_data in enumerate(sample_linkedin_job_data):
-                    stored_job = session.db.get_job(job_data['job_id'])
-                    assert stored_job['description'] == descriptions[i]
+                job_ids = [job_data['job_id'] for job_data in sample_linkedin_job_data]
+                stored = fetch_jobs(session.db.db_path, job_ids, ['description'])
+                assert {job_id: stored[job_id]['description'] for job_id in job_ids} == dict(zip(job_ids, descriptions))
 
                 # Verify FTS table was populated with descriptions
                 with sqlite3.connect(session.db.db_path) as conn:
@@ -191,23 +287,17 @@ class TestCompleteWorkflowIntegration:
                     ).fetchall()
                     assert len(fts_results) == 2  # Two jobs mention Python
 
-    def test_incremental_scraping_with_updates(self, mock_linkedin_session, sample_linkedin_job_data):
+    def test_incremental_scraping_with_updates(self, initial_scrape, sample_linkedin_job_data):
         """
         Test incremental scraping where some jobs are new and others are updates.
 
         Verifies that the workflow properly handles job deduplication
         and updates existing records when data changes.
         """
-        session = mock_linkedin_session
-
-        # First scraping run
-        with patch.object(session, '_scrape_job_listings') as mock_scrape:
-            mock_scrape.return_value = sample_linkedin_job_data
-
-            first_result = session.scrape_jobs_to_database(search_terms="test")
-
-            assert first_result['new_jobs'] == 3
-            assert first_result['updated_jobs'] == 0
+        # First scraping run (shared across tests via initial_scrape)
+        session, first_result = initial_scrape
+        assert first_result['new_jobs'] == 3
+        assert first_result['updated_jobs'] == 0
 
         # Second scraping run with some updated data
         updated_job_data = sample_linkedin_job_data.copy()
@@ -291,29 +381,22 @@ class TestCompleteWorkflowIntegration:
                 assert result['descriptions_extracted'] == 2  # 2 successful, 1 failed
 
                 # Verify successful descriptions were stored
-                job1 = session.db.get_job('integration_job_1')
-                job2 = session.db.get_job('integration_job_2')
-                job3 = session.db.get_job('integration_job_3')
+                stored = fetch_jobs(session.db.db_path, JOB_IDS, ['description'])
 
-                assert job1['description'] == "Successfully extracted description 1"
-                assert job2['description'] is None  # Failed extraction
-                assert job3['description'] == "Successfully extracted description 3"
+                assert stored['integration_job_1']['description'] == "Successfully extracted description 1"
+                assert stored['integration_job_2']['description'] is None  # Failed extraction
+                assert stored['integration_job_3']['description'] == "Successfully extracted description 3"
 
-    def test_workflow_with_job_lifecycle_management(self, mock_linkedin_session, sample_linkedin_job_data):
+    def test_workflow_with_job_lifecycle_management(self, initial_scrape, sample_linkedin_job_data):
         """
         Test complete workflow including job lifecycle management.
 
         Verifies that jobs not found in latest scrape are marked as 'removed'
         to track job posting lifecycle.
         """
-        session = mock_linkedin_session
-
-        # Initial scraping with all jobs
-        with patch.object(session, '_scrape_job_listings') as mock_scrape:
-            mock_scrape.return_value = sample_linkedin_job_data
-
-            first_result = session.scrape_jobs_to_database(search_terms="test")
-            assert first_result['new_jobs'] == 3
+        # Initial scraping with all jobs (shared across tests via initial_scrape)
+        session, first_result = initial_scrape
+        assert first_result['new_jobs'] == 3
 
         # Second scraping with only some jobs still available
         remaining_jobs = sample_linkedin_job_data[:2]  # Only first two jobs
@@ -329,15 +412,14 @@ class TestCompleteWorkflowIntegration:
             assert removed_count == 1  # integration_job_3 should be marked removed
 
             # Verify job statuses
-            job1 = session.db.get_job('integration_job_1')
-            job2 = session.db.get_job('integration_job_2')
-            job3 = session.db.get_job('integration_job_3')
-
-            assert job1['status'] == 'active'
-            assert job2['status'] == 'active'
-            assert job3['status'] == 'removed'
+            stored = fetch_jobs(session.db.db_path, JOB_IDS, ['status'])
+            assert {job_id: row['status'] for job_id, row in stored.items()} == {
+                'integration_job_1': 'active',
+                'integration_job_2': 'active',
+                'integration_job_3': 'removed',
+            }
 
-    def test_workflow_performance_with_large_dataset(self, mock_linkedin_session):
+    def test_workflow_performance_with_large_dataset(self, mock_linkedin_session, large_job_dataset):
         """
         Test workflow performance and database efficiency with larger datasets.
 
@@ -345,21 +427,7 @@ class TestCompleteWorkflowIntegration:
         without performance issues.
         """
         session = mock_linkedin_session
-
-        # Generate a larger dataset (50 jobs)
-        large_job_dataset = []
-        for i in range(50):
-            large_job_dataset.append({
-                'job_id': f'perf_test_job_{i:03d}',
-                'title': f'Software Engineer {i}',
-                'company': f'Company_{i % 10}',  # 10 different companies
-                'work_type': ['Remote', 'Hybrid', 'On-site'][i % 3],
-                'location': f'City_{i % 5}, State',  # 5 different locations
-                'salary': f'${90 + i}K/yr - ${120 + i}K/yr',
-                'benefits': 'Standard benefits package',
-                'url': f'https://www.linkedin.com/jobs/view/perf_test_job_{i:03d}',
-                'description': None
-            })
+        job_count = len(large_job_dataset)
 
         with patch.object(session, '_scrape_job_listings') as mock_scrape:
             mock_scrape.return_value = large_job_dataset
@@ -374,16 +442,16 @@ class TestCompleteWorkflowIntegration:
             processing_time = end_time - start_time
 
             # Verify all jobs were processed
-            assert result['jobs_processed'] == 50
-            assert result['new_jobs'] == 50
+            assert result['jobs_processed'] == job_count
+            assert result['new_jobs'] == job_count
 
-            # Performance should be reasonable (less than 5 seconds for 50 jobs)
-            assert processing_time < 5.0
+            # Performance should be reasonable (5 seconds per 50 jobs)
+            assert processing_time < job_count / 10
 
             # Verify database integrity
             stats = session.db.get_stats()
-            assert stats['total_jobs'] == 50
-            assert stats['active_jobs'] == 50
+            assert stats['total_jobs'] == job_count
+            assert stats['active_jobs'] == job_count
             assert len(stats['top_companies']) == 10  # 10 different companies
 
 
@@ -420,36 +488,12 @@ class TestCLIWorkflowIntegration:
         for job in job_data:
             temp_database.upsert_job(job)
 
-        # Test CLI search functionality
-        from script.linkedin_auth import main
-        from io import StringIO
-
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': True,
-                    '<query>': 'Python',
-                    '--company': None,
-                    '--location': None,
-                    '--work-type': None,
-                    '--min-salary': None,
-                    '--max-salary': None,
-                    '--limit': '100',
-                    'login': False,
-                    'db-stats': False,
-                    'decrypt-cookies': False
-                }
-
-                # Mock database to return our test data
-                mock_db_class.return_value = temp_database
-
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
-
-                output = mock_stdout.getvalue()
-                assert "Python Developer" in output
-                assert "TechCorp" in output
-                assert "$100K/yr - $120K/yr" in output
+        # Test CLI search rendering directly against the populated database
+        output = render_search(temp_database, 'Python')
+
+        assert "Python Developer" in output
+        assert "TechCorp" in output
+        assert "$100K/yr - $120K/yr" in output
 
     def test_cli_stats_after_scraping_workflow(self, temp_database):
         """
@@ -488,62 +532,32 @@ class TestCLIWorkflowIntegration:
         temp_database.create_scrape_session(session1)
         temp_database.create_scrape_session(session2)
 
-        # Test CLI stats functionality
-        from script.linkedin_auth import main
-        from io import StringIO
-
-        with patch('script.linkedin_auth.docopt') as mock_docopt:
-            with patch('script.linkedin_auth.JobDatabase') as mock_db_class:
-                mock_docopt.return_value = {
-                    'search-jobs': False,
-                    'db-stats': True,
-                    'login': False,
-                    'decrypt-cookies': False
-                }
-
-                mock_db_class.return_value = temp_database
-
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                    main()
+        # Test CLI stats rendering directly against the populated database
+        output = render_stats(temp_database)
 
-                output = mock_stdout.getvalue()
+        # Verify statistics are displayed correctly
+        assert "Total Jobs: 4" in output
+        assert "Active Jobs: 3" in output  # 3 active, 1 removed
+        assert "Total Scrape Sessions: 2" in output
 
-                # Verify statistics are displayed correctly
-                assert "Total Jobs: 4" in output
-                assert "Active Jobs: 3" in output  # 3 active, 1 removed
-                assert "Total Scrape Sessions: 2" in output
-
-                # Verify breakdowns
-                assert "active: 3" in output
-                assert "removed: 1" in output
-                assert "TechCorp: 2" in output  # Most common company
-                assert "Remote: 2" in output   # Most common work type
+        # Verify breakdowns
+        assert "active: 3" in output
+        assert "removed: 1" in output
+        assert "TechCorp: 2" in output  # Most common company
+        assert "Remote: 2" in output   # Most common work type
 
 
 class TestWorkflowEdgeCases:
     """Test edge cases and error conditions in workflows."""
 
-    @pytest.fixture
-    def temp_database(self):
-        """Create a temporary database for edge case testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "edge_test.db"
-            yield JobDatabase(db_path=db_path)
-
-    def test_workflow_with_duplicate_job_ids(self, temp_database):
+    def test_workflow_with_duplicate_job_ids(self, mock_linkedin_session, temp_database):
         """
         Test workflow handling when scraping returns duplicate job IDs.
 
         Verifies that duplicate job IDs within a single scraping session
         are handled appropriately.
         """
-        # Create mock session
-        with patch('lib.linkedin_session.load_dotenv'):
-            with patch('lib.linkedin_session.Path.mkdir'):
-                with patch.dict('os.environ', {'COOKIE_ENCRYPTION_KEY': 'rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs='}):
-                    session = LinkedInSession(headless=True)
-                    session.driver = MagicMock()
-                    session.db = temp_database
+        session = mock_linkedin_session
 
         duplicate_job_data = [
             {
@@ -568,19 +582,14 @@ class TestWorkflowEdgeCases:
             stored_job = temp_database.get_job('duplicate_test')
             assert stored_job is not None
 
-    def test_workflow_with_empty_scrape_results(self, temp_database):
+    def test_workflow_with_empty_scrape_results(self, mock_linkedin_session):
         """
         Test workflow handling when scraping returns no results.
 
         Verifies that empty scraping results are handled gracefully
         without errors.
         """
-        with patch('lib.linkedin_session.load_dotenv'):
-            with patch('lib.linkedin_session.Path.mkdir'):
-                with patch.dict('os.environ', {'COOKIE_ENCRYPTION_KEY': 'rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs='}):
-                    session = LinkedInSession(headless=True)
-                    session.driver = MagicMock()
-                    session.db = temp_database
+        session = mock_linkedin_session
 
         with patch.object(session, '_scrape_job_listings') as mock_scrape:
             mock_scrape.return_value = []  # Empty results
@@ -592,19 +601,14 @@ class TestWorkflowEdgeCases:
             assert result['jobs_processed'] == 0
             assert result['new_jobs'] == 0
 
-    def test_workflow_with_malformed_job_data(self, temp_database):
+    def test_workflow_with_malformed_job_data(self, mock_linkedin_session):
         """
         Test workflow handling of malformed or incomplete job data.
 
         Verifies that jobs with missing required fields or invalid data
         are handled appropriately without breaking the workflow.
         """
-        with patch('lib.linkedin_session.load_dotenv'):
-            with patch('lib.linkedin_session.Path.mkdir'):
-                with patch.dict('os.environ', {'COOKIE_ENCRYPTION_KEY': 'rqKVCgpWxjqjdOddPVxft-kLK6oOkecU029UGm_kUFs='}):
-                    session = LinkedInSession(headless=True)
-                    session.driver = MagicMock()
-                    session.db = temp_database
+        session = mock_linkedin_session
 
         malformed_job_data = [
             {
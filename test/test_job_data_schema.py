@@ -7,6 +7,8 @@ are always present, either with actual data or explicit null values.
 
 import pytest
 import json
+from functools import lru_cache
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -18,82 +20,116 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from lib.linkedin_session import LinkedInSession
 
 
+# Scraper output checked by the schema consistency test
+SCRAPED_JOBS_PATH = Path(__file__).resolve().parents[1] / "data" / "test_data" / "test_job_id_extraction.json"
+
+# Substring identifying each field's selector. The generic "jobs" (link)
+# substring comes last so it never shadows a more specific field selector.
+SELECTOR_FIELDS = (
+    ("job-card-container__primary-description", "title"),
+    ("artdeco-entity-lockup__subtitle", "company"),
+    ("job-card-container__metadata-item", "work_type"),
+    ("artdeco-entity-lockup__caption", "location"),
+    ("job-card-container__salary-info", "salary"),
+    ("job-card-container__benefits", "benefits"),
+    ("jobs", "url"),
+)
+
+
+@lru_cache(maxsize=None)
+def _field_for_selector(selector):
+    """Map a full selector string to its field name (None if unknown), once per selector."""
+    for substring, field in SELECTOR_FIELDS:
+        if substring in selector:
+            return field
+    return None
+
+
+@pytest.fixture(scope="module")
+def job_mock_factory():
+    """
+    Return make(fields), which builds a fresh mock job card element per call.
+
+    fields maps field names from SELECTOR_FIELDS to their text (the href
+    for 'url'). find_element serves only those fields and raises
+    NoSuchElementException for every other selector.
+    """
+    def make(fields):
+        dispatch = {}
+        for field, value in fields.items():
+            element = Mock()
+            if field == 'url':
+                element.get_attribute.return_value = value
+            else:
+                element.text = value
+            dispatch[field] = element
+
+        def find_element(by_type, selector):
+            element = dispatch.get(_field_for_selector(selector))
+            if element is None:
+                raise NoSuchElementException()
+            return element
+
+        return Mock(find_element=Mock(side_effect=find_element))
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def session():
+    """
+    LinkedInSession without running __init__.
+
+    _extract_job_data only reads the element it is given, so the tests
+    skip the constructor's browser and environment setup.
+    """
+    return LinkedInSession.__new__(LinkedInSession)
+
+
+@pytest.fixture(scope="session")
+def scraped_jobs_data():
+    """Parsed scraper output, loaded once per session."""
+    try:
+        return json.loads(SCRAPED_JOBS_PATH.read_bytes())
+    except FileNotFoundError:
+        pytest.skip("Test JSON file not found - run scraper first")
+
+
 class TestJobDataSchema:
     """Test that job data always contains all expected fields with explicit nulls."""
 
-    EXPECTED_FIELDS = {
-        'index': int,
-        'job_id': (str, type(None)),
-        'url': (str, type(None)),
-        'title': (str, type(None)),
-        'company': (str, type(None)),
-        'work_type': (str, type(None)),
-        'location': (str, type(None)),
-        'salary': (str, type(None)),
-        'benefits': (str, type(None))
-    }
-
-    def test_job_data_has_all_expected_fields_when_all_present(self):
+    # (field name, allowed types) pairs, in output order
+    EXPECTED_FIELDS = (
+        ('index', (int,)),
+        ('job_id', (str, type(None))),
+        ('url', (str, type(None))),
+        ('title', (str, type(None))),
+        ('company', (str, type(None))),
+        ('work_type', (str, type(None))),
+        ('location', (str, type(None))),
+        ('salary', (str, type(None))),
+        ('benefits', (str, type(None))),
+    )
+    EXPECTED_FIELD_NAMES = frozenset(dict(EXPECTED_FIELDS))
+
+    def test_job_data_has_all_expected_fields_when_all_present(self, session, job_mock_factory):
         """Test that job with all data present has all expected fields."""
-        session = LinkedInSession(headless=True)
-
         # Mock element with all data present
-        mock_element = Mock()
-
-        # Mock link element with job ID
-        mock_link = Mock()
-        mock_link.get_attribute.return_value = "https://www.linkedin.com/jobs/view/12345/?param=value"
-        mock_element.find_element.return_value = mock_link
-
-        # Mock title
-        mock_title = Mock()
-        mock_title.text = "Senior Engineer"
-
-        # Mock company
-        mock_company = Mock()
-        mock_company.text = "Tech Corp"
-
-        # Mock work type
-        mock_work_type = Mock()
-        mock_work_type.text = "Remote"
-
-        # Mock location
-        mock_location = Mock()
-        mock_location.text = "New York, NY"
-
-        # Mock salary
-        mock_salary = Mock()
-        mock_salary.text = "$100K/yr - $150K/yr"
-
-        # Mock benefits
-        mock_benefits = Mock()
-        mock_benefits.text = "401(k), Health"
-
-        # Setup find_element to return appropriate mocks
-        def mock_find_element(by_type, selector):
-            if "jobs" in selector:
-                return mock_link
-            elif "job-card-container__primary-description" in selector:
-                return mock_title
-            elif "artdeco-entity-lockup__subtitle" in selector:
-                return mock_company
-            elif "job-card-container__metadata-item" in selector:
-                return mock_work_type
-            elif "artdeco-entity-lockup__caption" in selector:
-                return mock_location
-            elif "job-card-container__salary-info" in selector:
-                return mock_salary
-            elif "job-card-container__benefits" in selector:
-                return mock_benefits
-            raise NoSuchElementException()
-
-        mock_element.find_element.side_effect = mock_find_element
+        mock_element = job_mock_factory({
+            'url': "https://www.linkedin.com/jobs/view/12345/?param=value",
+            'title': "Senior Engineer",
+            'company': "Tech Corp",
+            'work_type': "Remote",
+            'location': "New York, NY",
+            'salary': "$100K/yr - $150K/yr",
+            'benefits': "401(k), Health",
+        })
 
         job_data = session._extract_job_data(mock_element, 0)
 
         # Verify all expected fields are present
-        for field_name in self.EXPECTED_FIELDS:
-            assert field_name in job_data, f"Field '{field_name}' missing from job_data"
+        missing = self.EXPECTED_FIELD_NAMES - job_data.keys()
+        assert not missing, f"Fields {sorted(missing)} missing from job_data"
 
         # Verify data types
         assert isinstance(job_data['index'], int)
@@ -106,30 +142,16 @@ class TestJobDataSchema:
         assert isinstance(job_data['salary'], str)
         assert isinstance(job_data['benefits'], str)
 
-    def test_job_data_has_explicit_nulls_when_fields_missing(self):
+    def test_job_data_has_explicit_nulls_when_fields_missing(self, session, job_mock_factory):
         """Test that job with missing data has explicit null values for missing fields."""
-        session = LinkedInSession(headless=True)
-
         # Mock element with minimal data (only title available)
-        mock_element = Mock()
-
-        # Mock title (only field present)
-        mock_title = Mock()
-        mock_title.text = "Engineer Position"
-
-        # Setup find_element to only return title, everything else raises NoSuchElementException
-        def mock_find_element(by_type, selector):
-            if "job-card-container__primary-description" in selector:
-                return mock_title
-            raise NoSuchElementException()
-
-        mock_element.find_element.side_effect = mock_find_element
+        mock_element = job_mock_factory({'title': "Engineer Position"})
 
         job_data = session._extract_job_data(mock_element, 0)
 
         # Verify all expected fields are present
-        for field_name in self.EXPECTED_FIELDS:
-            assert field_name in job_data, f"Field '{field_name}' missing from job_data"
+        missing = self.EXPECTED_FIELD_NAMES - job_data.keys()
+        assert not missing, f"Fields {sorted(missing)} missing from job_data"
 
         # Verify explicit nulls for missing data
         assert job_data['index'] == 1  # Always set
@@ -142,41 +164,20 @@ class TestJobDataSchema:
         assert job_data['salary'] is None  # Missing -> explicit null
         assert job_data['benefits'] is None  # Missing -> explicit null
 
-    def test_job_data_partial_fields_present(self):
+    def test_job_data_partial_fields_present(self, session, job_mock_factory):
         """Test job with some fields present, others missing have explicit nulls."""
-        session = LinkedInSession(headless=True)
-
         # Mock element with partial data
-        mock_element = Mock()
-
-        # Mock available elements
-        mock_link = Mock()
-        mock_link.get_attribute.return_value = "https://www.linkedin.com/jobs/view/67890/"
-
-        mock_title = Mock()
-        mock_title.text = "Data Scientist"
-
-        mock_company = Mock()
-        mock_company.text = "AI Startup"
-
-        # Setup find_element to return some elements
-        def mock_find_element(by_type, selector):
-            if "jobs" in selector:
-                return mock_link
-            elif "job-card-container__primary-description" in selector:
-                return mock_title
-            elif "artdeco-entity-lockup__subtitle" in selector:
-                return mock_company
-            # All other selectors raise NoSuchElementException
-            raise NoSuchElementException()
-
-        mock_element.find_element.side_effect = mock_find_element
+        mock_element = job_mock_factory({
+            'url': "https://www.linkedin.com/jobs/view/67890/",
+            'title': "Data Scientist",
+            'company': "AI Startup",
+        })
 
         job_data = session._extract_job_data(mock_element, 1)
 
         # Verify all expected fields are present
-        for field_name in self.EXPECTED_FIELDS:
-            assert field_name in job_data, f"Field '{field_name}' missing from job_data"
+        missing = self.EXPECTED_FIELD_NAMES - job_data.keys()
+        assert not missing, f"Fields {sorted(missing)} missing from job_data"
 
         # Verify mixed data and nulls
         assert job_data['index'] == 2
@@ -189,31 +190,47 @@ class TestJobDataSchema:
         assert job_data['salary'] is None  # Missing -> explicit null
         assert job_data['benefits'] is None  # Missing -> explicit null
 
-    def test_scraped_jobs_json_schema_consistency(self):
+    def test_scraped_jobs_json_schema_consistency(self, scraped_jobs_data):
         """Test that actual scraped job data follows consistent schema."""
-        # This would test against real scraped data
-        test_json_path = "/Users/will/repo/thatnerd/job_search_automation/data/test_data/test_job_id_extraction.json"
-
-        try:
-            with open(test_json_path, 'r') as f:
-                data = json.load(f)
-
-            jobs = data.get('jobs', [])
-            assert len(jobs) > 0, "No jobs found in test data"
-
-            for i, job in enumerate(jobs):
-                # Verify all expected fields are present
-                for field_name in self.EXPECTED_FIELDS:
-                    assert field_name in job, f"Job {i}: Field '{field_name}' missing from job data"
-
-                # Verify field types (allowing null)
-                for field_name, expected_types in self.EXPECTED_FIELDS.items():
-                    if not isinstance(expected_types, tuple):
-                        expected_types = (expected_types,)
-
-                    actual_value = job[field_name]
-                    assert isinstance(actual_value, expected_types), \
-                        f"Job {i}: Field '{field_name}' has type {type(actual_value)}, expected {expected_types}"
-
-        except FileNotFoundError:
-            pytest.skip("Test JSON file not found - run scraper first")
\ No newline at end of file
+        jobs = scraped_jobs_data.get('jobs', [])
+        assert len(jobs) > 0, "No jobs found in test data"
+
+        for i, job in enumerate(jobs):
+            # Verify all expected fields are present
+            missing = self.EXPECTED_FIELD_NAMES - job.keys()
+            assert not missing, f"Job {i}: Fields {sorted(missing)} missing from job data"
+
+            # Verify field types (allowing null)
+            wrong_types = {
+                field_name: type(job[field_name]).__name__
+                for field_name, expected_types in self.EXPECTED_FIELDS
+                if not isinstance(job[field_name], expected_types)
+            }
+            assert not wrong_types, f"Job {i}: Fields with unexpected types: {wrong_types}"
+
+
+class TestSelectorDispatch:
+    """Test the selector-to-field lookup behind job_mock_factory."""
+
+    @pytest.mark.parametrize('selector,field', [
+        ("a.job-card-container__link[href*='/jobs/view/']", 'url'),
+        (".jobs-search .job-card-container__primary-description", 'title'),
+        (".jobs-search .artdeco-entity-lockup__subtitle", 'company'),
+        (".jobs-search .job-card-container__salary-info", 'salary'),
+        (".unrelated-selector", None),
+    ])
+    def test_specific_selector_wins_over_jobs_link(self, selector, field):
+        """
+        Test that field selectors are matched before the generic "jobs" link.
+
+        A selector containing both "jobs" and a field's substring must
+        resolve to that field, not the link.
+        """
+        assert _field_for_selector(selector) == field
+
+    def test_missing_field_does_not_fall_back_to_link(self, job_mock_factory):
+        """Test that a selector for an absent field raises even when it contains "jobs"."""
+        mock_element = job_mock_factory({'url': "https://www.linkedin.com/jobs/view/1/"})
+
+        with pytest.raises(NoSuchElementException):
+            mock_element.find_element(By.CSS_SELECTOR, ".jobs-search .job-card-container__primary-description")
@@ -9,6 +9,7 @@ Following TDD principles to ensure robust database operations.
 import os
 import sqlite3
 import tempfile
+from contextlib import closing
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -59,269 +60,195 @@ class TestJobDatabaseInit:
             assert db.db_path.exists()
             assert db.db_path.parent.exists()  # Parent directory created
 
-    def test_database_schema_creation(self):
+    def test_database_schema_creation(self, seed_db_path):
         """
         Test that all required tables, indexes, and triggers are created.
 
         Verifies the complete database schema matches the expected structure
         including generated columns, FTS tables, and triggers.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = JobDatabase(db_path=db_path)
-
-            # Test database connection and schema
-            with sqlite3.connect(db_path) as conn:
-                # Verify main tables exist
-                tables = conn.execute("""
-                    SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """).fetchall()
-
-                table_names = [row[0] for row in tables]
-                assert 'jobs' in table_names
-                assert 'scrape_sessions' in table_names
-                assert 'job_session_mapping' in table_names
-                assert 'jobs_fts' in table_names
-
-                # Verify jobs table structure including generated columns
-                jobs_columns = conn.execute("PRAGMA table_info(jobs)").fetchall()
-                column_names = [col[1] for col in jobs_columns]
-
-                # Basic columns that should always be visible
-                basic_columns = [
-                    'job_id', 'title', 'company', 'work_type', 'location', 'salary',
-                    'benefits', 'url', 'description', 'first_seen', 'last_seen',
-                    'status', 'source', 'created_at', 'updated_at'
-                ]
-                for col in basic_columns:
-                    assert col in column_names
-
-                # Test generated columns by trying to query them
-                try:
-                    conn.execute("SELECT salary_min_yearly, salary_max_yearly FROM jobs LIMIT 1").fetchall()
-                    generated_columns_exist = True
-                except sqlite3.OperationalError:
-                    generated_columns_exist = False
-
-                assert generated_columns_exist, "Generated columns salary_min_yearly and salary_max_yearly should exist"
-
-                # Verify indexes exist
-                indexes = conn.execute("""
-                    SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'
-                """).fetchall()
-
-                index_names = [row[0] for row in indexes]
-                expected_indexes = [
-                    'idx_jobs_company', 'idx_jobs_location', 'idx_jobs_work_type',
-                    'idx_jobs_status', 'idx_jobs_salary_range'
-                ]
-                for idx in expected_indexes:
-                    assert idx in index_names
-
-                # Verify triggers exist
-                triggers = conn.execute("""
-                    SELECT name FROM sqlite_master WHERE type='trigger'
-                """).fetchall()
-
-                trigger_names = [row[0] for row in triggers]
-                expected_triggers = [
-                    'jobs_fts_insert', 'jobs_fts_delete', 'jobs_fts_update', 'jobs_update_timestamp'
-                ]
-                for trigger in expected_triggers:
-                    assert trigger in trigger_names
-
-    def test_generated_columns_functionality(self):
+        # Test database connection and schema (read-only; the seed is shared).
+        # Autocommit mode: the metadata lookups need no implicit transaction.
+        with closing(sqlite3.connect(f"file:{seed_db_path}?mode=ro", uri=True,
+                                     isolation_level=None)) as conn:
+            # Fetch tables, jobs columns (table_xinfo includes generated
+            # columns), indexes and triggers in one round trip
+            rows = conn.execute("""
+                SELECT 't', name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'
+                UNION ALL SELECT 'c', name FROM pragma_table_xinfo('jobs')
+                UNION ALL SELECT 'i', name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'
+                UNION ALL SELECT 'g', name FROM sqlite_master WHERE type='trigger'
+            """).fetchall()
+
+        names = {kind: set() for kind in 'tcig'}
+        for kind, name in rows:
+            names[kind].add(name)
+
+        # Verify main tables exist
+        assert {'jobs', 'scrape_sessions', 'job_session_mapping', 'jobs_fts'} <= names['t']
+
+        # Verify jobs table structure including generated columns
+        basic_columns = {
+            'job_id', 'title', 'company', 'work_type', 'location', 'salary',
+            'benefits', 'url', 'description', 'first_seen', 'last_seen',
+            'status', 'source', 'created_at', 'updated_at'
+        }
+        assert basic_columns <= names['c']
+        assert {'salary_min_yearly', 'salary_max_yearly'} <= names['c'], \
+            "Generated columns salary_min_yearly and salary_max_yearly should exist"
+
+        # Verify indexes exist
+        assert {
+            'idx_jobs_company', 'idx_jobs_location', 'idx_jobs_work_type',
+            'idx_jobs_status', 'idx_jobs_salary_range'
+        } <= names['i']
+
+        # Verify triggers exist
+        assert {
+            'jobs_fts_insert', 'jobs_fts_delete', 'jobs_fts_update', 'jobs_update_timestamp'
+        } <= names['g']
+
+    def test_generated_columns_functionality(self, fresh_db_path):
         """
         Test that generated columns for salary parsing work correctly.
 
         Verifies that SQLite generated columns automatically parse salary
         values into min/max yearly amounts when jobs are inserted.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = JobDatabase(db_path=db_path)
-
-            with sqlite3.connect(db_path) as conn:
-                # Test single salary
-                conn.execute("""
-                    INSERT INTO jobs (job_id, title, salary)
-                    VALUES ('test1', 'Developer', '$100K/yr')
-                """)
-
-                result = conn.execute("""
-                    SELECT salary_min_yearly, salary_max_yearly FROM jobs WHERE job_id = 'test1'
-                """).fetchone()
-
-                assert result[0] == 100000  # min
-                assert result[1] == 100000  # max (same for single salary)
-
-                # Test salary range
-                conn.execute("""
-                    INSERT INTO jobs (job_id, title, salary)
-                    VALUES ('test2', 'Senior Dev', '$120K/yr - $150K/yr')
-                """)
-
-                result = conn.execute("""
-                    SELECT salary_min_yearly, salary_max_yearly FROM jobs WHERE job_id = 'test2'
-                """).fetchone()
+        rows = [
+            ('test1', 'Developer', '$100K/yr'),                    # single salary
+            ('test2', 'Senior Dev', '$120K/yr - $150K/yr'),        # salary range
+            ('test3', 'Contractor', 'Competitive salary'),         # non-matching format
+        ]
 
-                assert result[0] == 120000  # min
-                assert result[1] == 150000  # max
+        with closing(sqlite3.connect(fresh_db_path)) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO jobs (job_id, title, salary) VALUES (?, ?, ?)", rows
+                )
 
-                # Test non-matching salary format
-                conn.execute("""
-                    INSERT INTO jobs (job_id, title, salary)
-                    VALUES ('test3', 'Contractor', 'Competitive salary')
-                """)
+            results = conn.execute("""
+                SELECT job_id, salary_min_yearly, salary_max_yearly FROM jobs
+                WHERE job_id IN (?, ?, ?) ORDER BY job_id
+            """, [row[0] for row in rows]).fetchall()
 
-                result = conn.execute("""
-                    SELECT salary_min_yearly, salary_max_yearly FROM jobs WHERE job_id = 'test3'
-                """).fetchone()
+        assert results == [
+            ('test1', 100000, 100000),  # max same as min for single salary
+            ('test2', 120000, 150000),
+            ('test3', None, None),
+        ]
 
-                assert result[0] is None  # min
-                assert result[1] is None  # max
-
-    def test_fts_table_setup(self):
+    @pytest.mark.fts
+    def test_fts_table_setup(self, fresh_db_path):
         """
         Test that Full-Text Search (FTS) virtual table is properly configured.
 
         Verifies that the FTS table is created and synchronized with the main jobs table
         through triggers for insert, update, and delete operations.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = JobDatabase(db_path=db_path)
-
-            with sqlite3.connect(db_path) as conn:
-                # Insert a job and verify FTS table is populated
-                conn.execute("""
-                    INSERT INTO jobs (job_id, title, company, description)
-                    VALUES ('fts_test', 'Python Developer', 'TechCorp', 'Build amazing Python applications')
-                """)
-
-                # Check FTS table was populated via trigger
-                fts_result = conn.execute("""
-                    SELECT job_id, title, company, description FROM jobs_fts WHERE job_id = 'fts_test'
-                """).fetchone()
-
-                assert fts_result is not None
-                assert fts_result[0] == 'fts_test'
-                assert fts_result[1] == 'Python Developer'
-                assert fts_result[2] == 'TechCorp'
-                assert fts_result[3] == 'Build amazing Python applications'
-
-                # Test FTS search functionality
-                search_result = conn.execute("""
-                    SELECT job_id FROM jobs_fts WHERE jobs_fts MATCH 'Python'
-                """).fetchone()
-
-                assert search_result is not None
-                assert search_result[0] == 'fts_test'
+        with sqlite3.connect(fresh_db_path) as conn:
+            # Insert a job and verify FTS table is populated
+            conn.execute("""
+                INSERT INTO jobs (job_id, title, company, description)
+                VALUES ('fts_test', 'Python Developer', 'TechCorp', 'Build amazing Python applications')
+            """)
+
+            # Check FTS table was populated via trigger
+            fts_result = conn.execute("""
+                SELECT job_id, title, company, description FROM jobs_fts WHERE job_id = 'fts_test'
+            """).fetchone()
+
+            assert fts_result is not None
+            assert fts_result[0] == 'fts_test'
+            assert fts_result[1] == 'Python Developer'
+            assert fts_result[2] == 'TechCorp'
+            assert fts_result[3] == 'Build amazing Python applications'
+
+            # Test FTS search functionality
+            search_result = conn.execute("""
+                SELECT job_id FROM jobs_fts WHERE jobs_fts MATCH 'Python'
+            """).fetchone()
+
+            assert search_result is not None
+            assert search_result[0] == 'fts_test'
+
+
+# Salary strings and the (min, max) yearly amounts parse_salary should return
+SALARY_CASES = [
+    # Standard single salaries
+    ("$100K/yr", (100000, 100000)),
+    ("$85K/yr", (85000, 85000)),
+    ("$150K/yr", (150000, 150000)),
+    # Case insensitive
+    ("$100k/yr", (100000, 100000)),
+    ("$100K/YR", (100000, 100000)),
+    # With extra spaces and formatting
+    (" $100K/yr ", (100000, 100000)),
+    ("$100,000K/yr", (100000, 100000)),  # Comma removed
+
+    # Standard ranges
+    ("$100K/yr - $150K/yr", (100000, 150000)),
+    ("$80K/yr - $120K/yr", (80000, 120000)),
+    ("$200K/yr - $250K/yr", (200000, 250000)),
+    # Different spacing
+    ("$100K/yr-$150K/yr", (100000, 150000)),
+    ("$100K/yr  -  $150K/yr", (100000, 150000)),
+    # Case variations
+    ("$100k/yr - $150k/yr", (100000, 150000)),
+    ("$100K/YR - $150K/YR", (100000, 150000)),
+
+    # Empty or None inputs
+    (None, (None, None)),
+    ("", (None, None)),
+    ("   ", (None, None)),
+    # Non-matching formats
+    ("Competitive salary", (None, None)),
+    ("DOE", (None, None)),
+    ("$100/hour", (None, None)),
+    ("100K", (None, None)),  # Missing $ and /yr
+    ("$100K", (None, None)),  # Missing /yr
+    # Malformed ranges
+    ("$100K/yr - competitive", (None, None)),
+    ("DOE - $150K/yr", (None, None)),
+    # Invalid numbers
+    ("$XYZ/yr", (None, None)),
+    ("$/yr", (None, None)),
+
+    # Low salaries
+    ("$40K/yr", (40000, 40000)),
+    ("$25K/yr", (25000, 25000)),
+    # High salaries
+    ("$500K/yr", (500000, 500000)),
+    ("$1000K/yr", (1000000, 1000000)),
+    # Wide ranges
+    ("$50K/yr - $200K/yr", (50000, 200000)),
+    ("$100K/yr - $500K/yr", (100000, 500000)),
+
+    # Common LinkedIn formats
+    ("$90K/yr - $110K/yr", (90000, 110000)),
+    ("$130K/yr - $160K/yr", (130000, 160000)),
+    # Single salaries
+    ("$95K/yr", (95000, 95000)),
+    ("$125K/yr", (125000, 125000)),
+    # Non-parseable but common descriptions
+    ("Competitive salary and benefits", (None, None)),
+    ("Salary commensurate with experience", (None, None)),
+    ("Great benefits package", (None, None)),
+]
 
 
 class TestSalaryParsing:
     """Test salary parsing functionality with various input formats."""
 
-    def test_parse_salary_single_values(self):
-        """
-        Test parsing of single salary values in various formats.
-
-        Covers standard cases like "$100K/yr", "$85K/yr", etc.
-        """
-        # Standard single salaries
-        assert JobDatabase.parse_salary("$100K/yr") == (100000, 100000)
-        assert JobDatabase.parse_salary("$85K/yr") == (85000, 85000)
-        assert JobDatabase.parse_salary("$150K/yr") == (150000, 150000)
-
-        # Case insensitive
-        assert JobDatabase.parse_salary("$100k/yr") == (100000, 100000)
-        assert JobDatabase.parse_salary("$100K/YR") == (100000, 100000)
-
-        # With extra spaces and formatting
-        assert JobDatabase.parse_salary(" $100K/yr ") == (100000, 100000)
-        assert JobDatabase.parse_salary("$100,000K/yr") == (100000, 100000)  # Comma removed
-
-    def test_parse_salary_ranges(self):
-        """
-        Test parsing of salary ranges like "$100K/yr - $150K/yr".
-
-        Covers various range formats with different spacing and formatting.
-        """
-        # Standard ranges
-        assert JobDatabase.parse_salary("$100K/yr - $150K/yr") == (100000, 150000)
-        assert JobDatabase.parse_salary("$80K/yr - $120K/yr") == (80000, 120000)
-        assert JobDatabase.parse_salary("$200K/yr - $250K/yr") == (200000, 250000)
-
-        # Different spacing
-        assert JobDatabase.parse_salary("$100K/yr-$150K/yr") == (100000, 150000)
-        assert JobDatabase.parse_salary("$100K/yr  -  $150K/yr") == (100000, 150000)
-
-        # Case variations
-        assert JobDatabase.parse_salary("$100k/yr - $150k/yr") == (100000, 150000)
-        assert JobDatabase.parse_salary("$100K/YR - $150K/YR") == (100000, 150000)
-
-    def test_parse_salary_edge_cases(self):
-        """
-        Test salary parsing with edge cases and invalid inputs.
-
-        Ensures robust handling of malformed or non-standard salary strings.
-        """
-        # Empty or None inputs
-        assert JobDatabase.parse_salary(None) == (None, None)
-        assert JobDatabase.parse_salary("") == (None, None)
-        assert JobDatabase.parse_salary("   ") == (None, None)
-
-        # Non-matching formats
-        assert JobDatabase.parse_salary("Competitive salary") == (None, None)
-        assert JobDatabase.parse_salary("DOE") == (None, None)
-        assert JobDatabase.parse_salary("$100/hour") == (None, None)
-        assert JobDatabase.parse_salary("100K") == (None, None)  # Missing $ and /yr
-        assert JobDatabase.parse_salary("$100K") == (None, None)  # Missing /yr
-
-        # Malformed ranges
-        assert JobDatabase.parse_salary("$100K/yr - competitive") == (None, None)
-        assert JobDatabase.parse_salary("DOE - $150K/yr") == (None, None)
-
-        # Invalid numbers
-        assert JobDatabase.parse_salary("$XYZ/yr") == (None, None)
-        assert JobDatabase.parse_salary("$/yr") == (None, None)
-
-    def test_parse_salary_boundary_values(self):
-        """
-        Test salary parsing with boundary values and large numbers.
-
-        Ensures parsing works correctly for very low and very high salaries.
-        """
-        # Low salaries
-        assert JobDatabase.parse_salary("$40K/yr") == (40000, 40000)
-        assert JobDatabase.parse_salary("$25K/yr") == (25000, 25000)
-
-        # High salaries
-        assert JobDatabase.parse_salary("$500K/yr") == (500000, 500000)
-        assert JobDatabase.parse_salary("$1000K/yr") == (1000000, 1000000)
-
-        # Wide ranges
-        assert JobDatabase.parse_salary("$50K/yr - $200K/yr") == (50000, 200000)
-        assert JobDatabase.parse_salary("$100K/yr - $500K/yr") == (100000, 500000)
-
-    def test_parse_salary_real_world_examples(self):
+    @pytest.mark.parametrize("raw,expected", SALARY_CASES)
+    def test_parse_salary(self, raw, expected):
         """
-        Test salary parsing with real-world examples from job sites.
+        Test parse_salary against single values, ranges, edge cases,
+        boundary values and real-world examples.
 
-        Based on actual salary strings commonly found on LinkedIn and other job sites.
+        Each case reports its own input on failure.
         """
-        # Common LinkedIn formats
-        assert JobDatabase.parse_salary("$90K/yr - $110K/yr") == (90000, 110000)
-        assert JobDatabase.parse_salary("$130K/yr - $160K/yr") == (130000, 160000)
-
-        # Single salaries
-        assert JobDatabase.parse_salary("$95K/yr") == (95000, 95000)
-        assert JobDatabase.parse_salary("$125K/yr") == (125000, 125000)
-
-        # Non-parseable but common descriptions
-        assert JobDatabase.parse_salary("Competitive salary and benefits") == (None, None)
-        assert JobDatabase.parse_salary("Salary commensurate with experience") == (None, None)
-        assert JobDatabase.parse_salary("Great benefits package") == (None, None)
+        assert JobDatabase.parse_salary(raw) == expected
 
 
 class TestJobRecord:
@@ -448,22 +375,20 @@ class TestScrapeSession:
 class TestDatabaseCleanup:
     """Test database cleanup and resource management."""
 
-    def test_close_method(self):
+    def test_close_method(self, fresh_db_path):
         """
         Test that the close method exists and can be called safely.
 
         Since SQLite connections are managed via context managers,
         this mainly tests that the method exists and doesn't throw errors.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = JobDatabase(db_path=db_path)
+        db = JobDatabase(db_path=fresh_db_path)
 
-            # Should not raise any exceptions
-            db.close()
+        # Should not raise any exceptions
+        db.close()
 
-            # Database file should still exist
-            assert db.db_path.exists()
+        # Database file should still exist
+        assert db.db_path.exists()
 
     def test_database_file_permissions(self):
         """
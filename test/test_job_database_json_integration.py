@@ -10,6 +10,7 @@ import sqlite3
 import json
 import tempfile
 import pytest
+from contextlib import closing
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any
@@ -343,6 +344,22 @@ class TestPerformanceWithJSONBackend:
             db_path = Path(temp_dir) / "performance_test.db"
             yield JobDatabase(db_path=db_path)
 
+    @staticmethod
+    def bulk_insert_jobs(db_path, jobs):
+        """
+        Seed jobs as JSON rows with one executemany in a single transaction.
+
+        For tests that need data in place but are not measuring upsert_job.
+        Rows are serialized with JobRecord.to_json_dict(), the same shape
+        upsert_job stores; the generated columns derive the rest.
+        """
+        rows = [(json.dumps(job.to_json_dict()),) for job in jobs]
+        with closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.executemany("""
+                INSERT INTO jobs (json_data, first_seen, last_seen, created_at, updated_at)
+                VALUES (json(?), datetime('now'), datetime('now'), datetime('now'), datetime('now'))
+            """, rows)
+
     def test_bulk_insert_performance_json(self, performance_db):
         """
         Test performance of bulk job insertion with JSON storage.
@@ -400,8 +417,8 @@ class TestPerformanceWithJSONBackend:
         import time
 
         # Insert test data
-        for i in range(50):
-            job = JobRecord(
+        self.bulk_insert_jobs(performance_db.db_path, [
+            JobRecord(
                 job_id=f"search_perf_{i:03d}",
                 title=f"Engineer {i}",
                 company=f"TestCorp{i % 5}",
@@ -412,7 +429,8 @@ class TestPerformanceWithJSONBackend:
                 status="active",
                 source="linkedin"
             )
-            performance_db.upsert_job(job)
+            for i in range(50)
+        ])
 
         # Test various search patterns
         search_tests = [
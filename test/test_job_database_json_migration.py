@@ -110,6 +110,7 @@ class TestFreshDatabaseCreation:
                 for removed_idx in removed_indexes:
                     assert removed_idx not in index_info, f"Index {removed_idx} should not exist"
 
+    @pytest.mark.fts
     def test_fresh_database_fts_setup(self):
         """
         Test that fresh databases create FTS tables compatible with JSON.
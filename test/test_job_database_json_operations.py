@@ -418,6 +418,7 @@ class TestJSONSearchOperations:
         low_max_ids = {job['job_id'] for job in low_max_jobs}
         assert low_max_ids == {"json_search_3", "json_search_4"}
 
+    @pytest.mark.fts
     def test_search_jobs_fts_with_json(self, populated_json_db):
         """
         Test full-text search functionality with JSON storage.